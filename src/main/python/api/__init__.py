@@ -0,0 +1,5 @@
+"""HTTP access to generated reports."""
+
+from .server import ReportServer, serve
+
+__all__ = ["ReportServer", "serve"]
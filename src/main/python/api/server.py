@@ -0,0 +1,334 @@
+"""Local HTTP server for rendered reports."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import chain
+from pathlib import Path
+from typing import Callable, Hashable, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from core.generator import ReportGenerator
+from models.report import Report
+from services.git_service import get_week_range
+from utils.file_watcher import stat_signature
+
+
+@dataclass
+class Artifact:
+    """A rendered response body with its validator."""
+    body: bytes
+    content_type: str
+    etag: str
+
+
+class LRUCache:
+    """A thread-safe mapping that keeps at most ``max_entries`` recently used items."""
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable):
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ReportServer(ThreadingHTTPServer):
+    """Serves reports for any author and week from one warm generator.
+
+    Routes:
+        /report.html, /report.json   the whole report
+        /slides/summary.svg          the summary slide
+        /slides/<n>.svg              the n-th task slide, counting from 1
+        /stats                       cache statistics
+
+    Every route takes optional ``author`` and ``week`` (any date within the
+    week, ``YYYY-MM-DD``) query parameters, defaulting to the git user and
+    the current week.
+
+    Rendered artifacts are cached by author, week and the state of the
+    inputs: the task source's size and mtime and each repository's HEAD.
+    Checking that state costs a ``stat`` and a HEAD lookup on the
+    generator's persistent git process, so a dashboard re-polling an
+    unchanged report gets a cached body, or a 304 if it sends the ETag back.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        generator: ReportGenerator,
+        use_task_file: bool = True,
+        cache_size: int = 128,
+        verbose: bool = False
+    ):
+        super().__init__(address, ReportRequestHandler)
+        self.generator = generator
+        self.use_task_file = use_task_file
+        self.verbose = verbose
+        self.artifacts = LRUCache(cache_size)
+        # Several artifacts usually come from one report (a deck of slides)
+        self.reports = LRUCache(max(1, cache_size // 8))
+        self.default_author: Optional[str] = None
+        # The generator's services keep unsynchronized caches
+        self._generate_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def source_path(self) -> Optional[Path]:
+        """The journal or task file (or daily directory) reports are read from."""
+        if not self.use_task_file:
+            return None
+        if self.generator.journal_service:
+            return self.generator.journal_service.file_path
+        task_file_service = self.generator.task_file_service
+        path = task_file_service.file_path
+        if task_file_service.is_daily and not path.is_dir():
+            return path.parent
+        return path
+
+    def state(self) -> tuple:
+        """Identify the current inputs: task source signature and repository HEADs."""
+        source_path = self.source_path
+        source = stat_signature(source_path) if source_path else ()
+        with self._generate_lock:
+            heads = self.generator.refresh_heads()
+        return source, heads
+
+    def resolve_author(self, author: Optional[str]) -> str:
+        if author:
+            return author
+        if self.default_author is None:
+            with self._generate_lock:
+                self.default_author = self.generator.git_service.get_author_name()
+        return self.default_author
+
+    def artifact(
+        self,
+        key: tuple,
+        render: Callable[[], tuple[bytes, str]]
+    ) -> Artifact:
+        """Get a cached artifact, rendering and caching it on a miss."""
+        artifact = self.artifacts.get(key)
+        if artifact is None:
+            body, content_type = render()
+            artifact = Artifact(body, content_type, etag_for(key))
+            self.artifacts.put(key, artifact)
+        return artifact
+
+    def report(self, author: str, week_start: datetime, week_end: datetime, state: tuple) -> Report:
+        key = (author, week_start, state)
+        report = self.reports.get(key)
+        if report is None:
+            with self._generate_lock:
+                report = self.generator.generate(
+                    week_start=week_start,
+                    week_end=week_end,
+                    author=author,
+                    use_task_file=self.use_task_file
+                )
+            self.reports.put(key, report)
+        return report
+
+    def stats(self) -> dict:
+        return {
+            "artifacts": len(self.artifacts),
+            "artifact_hits": self.artifacts.hits,
+            "artifact_misses": self.artifacts.misses,
+            "reports": len(self.reports),
+            "report_hits": self.reports.hits,
+            "report_misses": self.reports.misses
+        }
+
+
+class ReportRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for ``ReportServer``."""
+
+    server: ReportServer
+    server_version = "StatusReport/1.0"
+
+    def do_GET(self) -> None:
+        self._handle(send_body=True)
+
+    def do_HEAD(self) -> None:
+        self._handle(send_body=False)
+
+    def _handle(self, send_body: bool) -> None:
+        url = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        route = url.path.rstrip("/") or "/"
+
+        if route == "/stats":
+            body = json.dumps(self.server.stats(), indent=2).encode("utf-8")
+            self._send(HTTPStatus.OK, body, "application/json", send_body=send_body)
+            return
+
+        if route == "/report.html":
+            kind, slide = "html", None
+        elif route == "/report.json":
+            kind, slide = "json", None
+        elif route.startswith("/slides/") and route.endswith(".svg"):
+            kind, slide = "svg", route[len("/slides/"):-len(".svg")]
+            if slide != "summary" and not slide.isdigit():
+                self._send_error(HTTPStatus.NOT_FOUND, f"No slide {slide}", send_body)
+                return
+        else:
+            self._send_error(HTTPStatus.NOT_FOUND, f"Unknown path {url.path}", send_body)
+            return
+
+        try:
+            week_start, week_end = parse_week(query.get("week"))
+        except ValueError as e:
+            self._send_error(HTTPStatus.BAD_REQUEST, str(e), send_body)
+            return
+
+        try:
+            author = self.server.resolve_author(query.get("author"))
+            key = (kind, slide, author, week_start, self.server.state())
+            # Checked before anything is rendered or looked up
+            if self._etag_matches(etag_for(key)):
+                self._send(HTTPStatus.NOT_MODIFIED, b"", etag=etag_for(key), send_body=False)
+                return
+
+            def report() -> Report:
+                return self.server.report(author, week_start, week_end, key[-1])
+
+            artifact = self.server.artifact(key, lambda: self._render(kind, slide, report))
+        except LookupError as e:
+            self._send_error(HTTPStatus.NOT_FOUND, str(e), send_body)
+            return
+        except Exception as e:
+            self._send_error(HTTPStatus.INTERNAL_SERVER_ERROR, f"Error generating report: {e}", send_body)
+            return
+
+        self._send(HTTPStatus.OK, artifact.body, artifact.content_type,
+                   etag=artifact.etag, send_body=send_body)
+
+    def _render(self, kind: str, slide: Optional[str], get_report: Callable[[], Report]) -> tuple[bytes, str]:
+        report = get_report()
+        generator = self.server.generator
+        if kind == "html":
+            return generator.render_html(report).encode("utf-8"), "text/html; charset=utf-8"
+        if kind == "json":
+            return json.dumps(report.to_dict(), indent=2).encode("utf-8"), "application/json"
+
+        if slide == "summary":
+            svg = generator.svg_renderer.render_summary(report)
+        else:
+            tasks = list(chain.from_iterable(section.tasks for section in report.sections))
+            index = int(slide)
+            if not 1 <= index <= len(tasks):
+                raise LookupError(f"No slide {index}: the report has {len(tasks)} tasks")
+            svg = generator.svg_renderer.render_task(
+                tasks[index - 1], index, len(tasks), report.author, report.week_string
+            )
+        return svg.encode("utf-8"), "image/svg+xml"
+
+    def _etag_matches(self, etag: str) -> bool:
+        header = self.headers.get("If-None-Match")
+        if not header:
+            return False
+        tags = [tag.strip() for tag in header.split(",")]
+        return "*" in tags or etag in tags
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        body: bytes,
+        content_type: Optional[str] = None,
+        etag: Optional[str] = None,
+        send_body: bool = True
+    ) -> None:
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+            # Clients may keep the body but must revalidate it on every use
+            self.send_header("Cache-Control", "no-cache")
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if send_body and body:
+            self.wfile.write(body)
+
+    def _send_error(self, status: HTTPStatus, message: str, send_body: bool) -> None:
+        self._send(status, (message + "\n").encode("utf-8"), "text/plain; charset=utf-8",
+                   send_body=send_body)
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def etag_for(key: tuple) -> str:
+    """A weak ETag for an artifact key.
+
+    Weak, because re-rendering the same inputs changes the generation time
+    in the body while the report itself is the same.
+    """
+    digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def parse_week(value: Optional[str]) -> tuple[datetime, datetime]:
+    """Get the week containing a ``YYYY-MM-DD`` date, or the current week."""
+    if not value:
+        return get_week_range()
+    try:
+        return get_week_range(datetime.strptime(value, "%Y-%m-%d"))
+    except ValueError:
+        raise ValueError(f"Invalid week: {value}. Use YYYY-MM-DD") from None
+
+
+def serve(
+    generator: ReportGenerator,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    use_task_file: bool = True,
+    cache_size: int = 128,
+    verbose: bool = False
+) -> None:
+    """Serve reports until interrupted."""
+    with ReportServer((host, port), generator, use_task_file=use_task_file,
+                      cache_size=cache_size, verbose=verbose) as server:
+        print(f"Serving reports at {server.url}/report.html (Ctrl+C to stop)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped serving")
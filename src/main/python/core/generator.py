@@ -1,24 +1,120 @@
 """Core report generation logic."""
 
+import json
+import os
+import re
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional, TextIO
 
 from models.report import Report, Task, TaskStatus
+from services.git_executor import GitExecutor
 from services.git_service import GitService, get_week_range
-from services.html_renderer import HtmlRenderer
 from services.task_file_service import TaskFileService
-from services.svg_renderer import SvgRenderer
+
+if TYPE_CHECKING:
+    from services.deck_renderer import DeckRenderer
+    from services.html_renderer import HtmlRenderer
+    from services.journal_service import JournalService
+    from services.svg_renderer import SvgRenderer
+
+
+@dataclass
+class SlideStats:
+    """Statistics from the most recent SVG slide export."""
+    slides: int = 0
+    bytes_written: int = 0
+    # Inline logo bytes avoided by the slides written this run, less the shared logo file
+    bytes_saved: int = 0
+    skipped: int = 0
+    rewritten: int = 0
+
+
+@dataclass
+class StageTiming:
+    """When one input stage of the most recent ``generate`` ran.
+
+    Times are in seconds from the start of the call, so overlapping stages
+    show up as overlapping intervals.
+    """
+    name: str
+    start: float
+    end: float
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
 
 
 class ReportGenerator:
     """Generates weekly status reports from task file or Git data."""
 
-    def __init__(self, repo_path: Optional[str] = None, task_file: Optional[str] = None):
-        self.git_service = GitService(repo_path)
-        self.html_renderer = HtmlRenderer()
-        self.svg_renderer = SvgRenderer()
-        self.task_file_service = TaskFileService(task_file)
+    # Slide input hashes used for incremental SVG export
+    MANIFEST_FILENAME = ".slides_manifest.json"
+
+    # Default location for persistent caches (commit index, ...)
+    DEFAULT_CACHE_DIR = str(Path("output") / ".cache")
+
+    def __init__(
+        self,
+        repo_path: Optional[str] = None,
+        task_file: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        repo_paths: Optional[list[str]] = None,
+        git_jobs: int = 4,
+        git_timeout: Optional[float] = 60.0,
+        journal_file: Optional[str] = None
+    ):
+        self.cache_dir = cache_dir
+        self.git_jobs = max(1, git_jobs)
+        # One executor for all repositories, so git_jobs bounds git processes overall
+        self.git_executor = GitExecutor(max_concurrency=self.git_jobs, timeout=git_timeout)
+        # The first repository also supplies the default author
+        self.git_services = [
+            GitService(path, cache_dir=cache_dir, executor=self.git_executor)
+            for path in (repo_paths or [repo_path])
+        ]
+        self.git_service = self.git_services[0]
+        self.task_file_service = TaskFileService(task_file, cache_dir=cache_dir)
+        self.journal_service: Optional["JournalService"] = None
+        if journal_file:
+            from services.journal_service import JournalService
+            self.journal_service = JournalService(journal_file)
+        # Renderers are imported and created on first use, so a run only
+        # loads the one its output mode needs
+        self._html_renderer: Optional["HtmlRenderer"] = None
+        self._svg_renderer: Optional["SvgRenderer"] = None
+        self._deck_renderer: Optional["DeckRenderer"] = None
+        self.slide_stats = SlideStats()
+        self.stage_timings: list[StageTiming] = []
+
+    @property
+    def html_renderer(self) -> "HtmlRenderer":
+        if self._html_renderer is None:
+            from services.html_renderer import HtmlRenderer
+            self._html_renderer = HtmlRenderer()
+        return self._html_renderer
+
+    @property
+    def svg_renderer(self) -> "SvgRenderer":
+        if self._svg_renderer is None:
+            from services.svg_renderer import SvgRenderer
+            self._svg_renderer = SvgRenderer()
+        return self._svg_renderer
+
+    @property
+    def deck_renderer(self) -> "DeckRenderer":
+        if self._deck_renderer is None:
+            from services.deck_renderer import DeckRenderer
+            self._deck_renderer = DeckRenderer(self.svg_renderer)
+        return self._deck_renderer
+
+    def refresh_heads(self) -> tuple[str, ...]:
+        """Re-resolve HEAD in every repository; see ``GitService.refresh_head``."""
+        return tuple(git_service.refresh_head() for git_service in self.git_services)
 
     def generate(
         self,
@@ -27,40 +123,106 @@ class ReportGenerator:
         author: Optional[str] = None,
         blockers: Optional[list[str]] = None,
         in_progress: Optional[list[str]] = None,
-        use_task_file: bool = True
+        use_task_file: bool = True,
+        include_branches: bool = False,
+        include_remote_branches: bool = False,
+        compact: bool = False,
+        concurrent: bool = False
     ) -> Report:
-        """Generate a weekly status report."""
+        """Generate a weekly status report.
+
+        Tasks come from the journal's entries for the week when a journal is
+        configured, else from the task file when it exists, otherwise from the
+        commits of every configured repository. With ``include_branches``,
+        the author's branches active during the week are added as in-progress
+        items. With ``compact``, tasks are stored in columnar TaskTables,
+        which keeps very large commit-derived reports small in memory.
+
+        With ``concurrent``, the author lookup, the task source read and the
+        git work that does not depend on the author run at the same time
+        instead of one after another: resolving HEAD and, with a cache,
+        updating the commit index and, while the author is looked up,
+        fetching the week's commits for all authors from it. That
+        only starts once the task source is known to be missing, so reports
+        built from a task file never pay for a ``git log``. The author's
+        commits are selected after the join. Each stage's interval is
+        recorded in ``stage_timings``.
+        """
         # Get week range
         if week_start is None or week_end is None:
             week_start, week_end = get_week_range()
 
-        # Get author info
-        if author is None:
-            author = self.git_service.get_author_name()
+        started = time.perf_counter()
+        self.stage_timings = []
+
+        def timed(name: str, func: Callable, *args):
+            start = time.perf_counter()
+            try:
+                return func(*args)
+            finally:
+                self.stage_timings.append(
+                    StageTiming(name, start - started, time.perf_counter() - started)
+                )
 
-        # Create report
+        # Create report; with a concurrent author lookup the author is set once known
         report = Report(
-            author=author,
+            author=author or "",
             week_start=week_start,
             week_end=week_end
         )
+        if compact:
+            report.compact()
 
-        # Try to read from task file first
-        if use_task_file and self.task_file_service.file_exists():
-            file_tasks = self.task_file_service.read_tasks()
+        # Tasks from the journal or task file are streamed into the sections
+        if concurrent:
+            from concurrent.futures import ThreadPoolExecutor
 
-            for task in file_tasks["accomplished"]:
-                report.accomplished.add_task(task)
-            for task in file_tasks["in_progress"]:
-                report.in_progress.add_task(task)
-            for task in file_tasks["blockers"]:
-                report.blockers.add_task(task)
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                # Measure the stages, not the pool setup
+                started = time.perf_counter()
+                author_future = (
+                    executor.submit(timed, "author", self.git_service.get_author_name)
+                    if author is None else None
+                )
+                source_future = executor.submit(
+                    timed, "tasks", self._add_source_tasks, report, week_start, week_end,
+                    use_task_file
+                )
+                git_future = executor.submit(
+                    timed, "git", self._prefetch_commits, week_start, week_end, use_task_file,
+                    author is None
+                )
+                if author_future is not None:
+                    author = author_future.result()
+                from_source = source_future.result()
+                git_future.result()
         else:
+            # Get author info
+            if author is None:
+                author = timed("author", self.git_service.get_author_name)
+            from_source = timed(
+                "tasks", self._add_source_tasks, report, week_start, week_end, use_task_file
+            )
+        report.author = author
+
+        if not from_source:
             # Fallback to git commits for accomplished section
-            commits = self.git_service.get_commits(week_start, week_end, author)
+            commits = timed("commits", self._get_commits, week_start, week_end, author)
             for commit in commits:
                 report.accomplished.add_task(commit)
 
+        if include_branches:
+            for git_service in self.git_services:
+                for branch in git_service.get_branches_in_progress(
+                    since=week_start,
+                    until=week_end,
+                    author=re.escape(author),
+                    include_remote=include_remote_branches
+                ):
+                    if len(self.git_services) > 1:
+                        branch.repo = git_service.repo_path.resolve().name
+                    report.in_progress.add_task(branch)
+
         # Add manually specified in-progress items (from CLI)
         if in_progress:
             for item_text in in_progress:
@@ -79,10 +241,159 @@ class ReportGenerator:
 
         return report
 
+    def _task_source_exists(self, use_task_file: bool = True) -> bool:
+        """Check whether the report's tasks come from the journal or task file."""
+        if not use_task_file:
+            return False
+        if self.journal_service and self.journal_service.file_exists():
+            return True
+        return self.task_file_service.file_exists()
+
+    def _add_source_tasks(
+        self,
+        report: Report,
+        week_start: datetime,
+        week_end: datetime,
+        use_task_file: bool = True
+    ) -> bool:
+        """Stream the week's tasks from the journal or task file into the report.
+
+        Returns False if neither exists, meaning the report comes from git.
+        """
+        if not use_task_file:
+            return False
+        if self.journal_service and self.journal_service.file_exists():
+            for task in self.journal_service.iter_week(week_start, week_end):
+                report.accomplished.add_task(task)
+            return True
+        if not self.task_file_service.file_exists():
+            return False
+
+        sections = {
+            "accomplished": report.accomplished,
+            "in_progress": report.in_progress,
+            "blockers": report.blockers
+        }
+        for section, task in self.task_file_service.iter_tasks(week_start, week_end):
+            sections[section].add_task(task)
+        return True
+
+    def _prefetch_commits(
+        self,
+        week_start: datetime,
+        week_end: datetime,
+        use_task_file: bool,
+        fetch_week: bool
+    ) -> None:
+        """Do the author-independent git work for the week unless a task source exists.
+
+        With ``fetch_week`` the week's commits are fetched for all authors
+        too, which only pays off while the author lookup is still running.
+        """
+        if self._task_source_exists(use_task_file):
+            return
+
+        def prefetch(git_service: GitService) -> None:
+            if fetch_week:
+                git_service.prefetch(week_start, week_end)
+            else:
+                git_service.prefetch()
+
+        if len(self.git_services) == 1:
+            prefetch(self.git_service)
+        else:
+            self._map_repositories(prefetch)
+
+    def _get_commits(
+        self,
+        week_start: datetime,
+        week_end: datetime,
+        author: Optional[str]
+    ) -> list[Task]:
+        """Get commits from all repositories, querying them concurrently.
+
+        With more than one repository each task is tagged with the name of
+        the repository it came from. At most ``git_jobs`` repositories are
+        queried at the same time; results keep the repository order.
+        """
+        if len(self.git_services) == 1:
+            return self.git_service.get_commits(week_start, week_end, author)
+
+        def fetch(git_service: GitService) -> list[Task]:
+            tasks = git_service.get_commits(week_start, week_end, author)
+            repo_name = git_service.repo_path.resolve().name
+            for task in tasks:
+                task.repo = repo_name
+            return tasks
+
+        results = self._map_repositories(fetch)
+        return [task for tasks in results for task in tasks]
+
+    def _map_repositories(self, func: Callable[[GitService], object]) -> list:
+        """Call ``func`` on each repository, ``git_jobs`` at a time, in repository order."""
+        # Imported here: concurrent.futures pulls in logging, which single-repository runs never need
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(self.git_jobs, len(self.git_services))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(func, self.git_services))
+
+    def generate_team(
+        self,
+        week_start: Optional[datetime] = None,
+        week_end: Optional[datetime] = None,
+        members: Optional[list[str]] = None
+    ) -> list[Report]:
+        """Generate one git-based report per author from a single pass over history.
+
+        Every repository is read once for the whole range and its commits are
+        partitioned by mailmap-normalized author identity. ``members``
+        optionally restricts the output to authors whose name or email
+        matches one of the entries (case-insensitive).
+        """
+        if week_start is None or week_end is None:
+            week_start, week_end = get_week_range()
+
+        def fetch(git_service: GitService) -> dict[str, tuple[str, list[Task]]]:
+            partitions = git_service.get_commits_by_author(week_start, week_end)
+            if len(self.git_services) > 1:
+                repo_name = git_service.repo_path.resolve().name
+                for _, tasks in partitions.values():
+                    for task in tasks:
+                        task.repo = repo_name
+            return partitions
+
+        results = self._map_repositories(fetch)
+
+        # Merge per-repository partitions, keeping repository order
+        merged: dict[str, tuple[str, list[Task]]] = {}
+        for partitions in results:
+            for identity, (name, tasks) in partitions.items():
+                if identity not in merged:
+                    merged[identity] = (name, [])
+                merged[identity][1].extend(tasks)
+
+        wanted = {m.strip().lower() for m in members or [] if m.strip()}
+
+        reports = []
+        for identity, (name, tasks) in sorted(merged.items(), key=lambda item: item[1][0].lower()):
+            if wanted and identity not in wanted and name.lower() not in wanted:
+                continue
+            report = Report(author=name, week_start=week_start, week_end=week_end)
+            for task in tasks:
+                report.accomplished.add_task(task)
+            reports.append(report)
+
+        return reports
+
     def render_html(self, report: Report) -> str:
         """Render a report to HTML."""
         return self.html_renderer.render(report)
 
+    def write_html(self, report: Report, fp: TextIO) -> None:
+        """Stream a report as HTML to a file-like object."""
+        self.html_renderer.render_to(report, fp)
+
     def save_html(
         self,
         report: Report,
@@ -96,17 +407,76 @@ class ReportGenerator:
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        html_content = self.render_html(report)
-        output_path.write_text(html_content, encoding="utf-8")
+        with output_path.open("w", encoding="utf-8") as f:
+            self.write_html(report, f)
+
+        return output_path
+
+    def save_snapshot(
+        self,
+        report: Report,
+        output_path: Optional[str] = None
+    ) -> Path:
+        """Save a report as a binary snapshot that can be re-rendered later."""
+        if output_path is None:
+            filename = f"status_report_{report.week_start.strftime('%Y%m%d')}.snap"
+            output_path = Path("output") / filename
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(report.to_snapshot())
+
+        return output_path
+
+    def load_snapshot(self, snapshot_path: str, compact: bool = False) -> Report:
+        """Load a report saved with ``save_snapshot``."""
+        return Report.from_snapshot(Path(snapshot_path).read_bytes(), compact=compact)
+
+    def save_deck(
+        self,
+        report: Report,
+        output_path: Optional[str] = None
+    ) -> Path:
+        """Save all SVG slides as a single self-contained HTML deck."""
+        if output_path is None:
+            filename = f"status_deck_{report.week_start.strftime('%Y%m%d')}.html"
+            output_path = Path("output") / filename
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        deck_content = self.deck_renderer.render(report)
+        output_path.write_text(deck_content, encoding="utf-8")
 
         return output_path
 
     def save_svg_slides(
         self,
         report: Report,
-        output_dir: Optional[str] = None
+        output_dir: Optional[str] = None,
+        shared_assets: bool = False,
+        jobs: int = 1,
+        incremental: bool = True
     ) -> list[Path]:
-        """Save report as multiple SVG slide files (one per task)."""
+        """Save report as multiple SVG slide files (one per task).
+
+        With ``shared_assets`` the logo is written once as a sidecar PNG in
+        the output directory and every slide references it by relative path,
+        instead of inlining the same base64 image into each slide.
+
+        With ``jobs`` > 1 task slides are rendered and written by a pool of
+        worker processes. Slides are staged in a temporary directory and only
+        moved into place once every slide succeeded, so a failing worker never
+        leaves a partially updated output directory.
+
+        With ``incremental`` a manifest in the output directory records a hash
+        of each slide's inputs, and slides whose hash is unchanged since the
+        last run are neither re-rendered nor rewritten.
+        """
+        import hashlib
+        import shutil
+        import tempfile
+
         if output_dir is None:
             output_dir = Path("output") / f"slides_{report.week_start.strftime('%Y%m%d')}"
         else:
@@ -115,36 +485,168 @@ class ReportGenerator:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Collect all tasks
-        all_tasks = []
-        all_tasks.extend(report.accomplished.tasks)
-        all_tasks.extend(report.in_progress.tasks)
-        all_tasks.extend(report.blockers.tasks)
+        # Chained rather than copied, so compact sections are not expanded up front
+        all_tasks = chain.from_iterable(section.tasks for section in report.sections)
 
-        total = len(all_tasks)
+        total = report.task_count
         saved_files = []
+        stats = SlideStats()
+
+        manifest_path = output_dir / self.MANIFEST_FILENAME
+        old_manifest = self._load_manifest(manifest_path) if incremental else {}
+        new_manifest = {}
+
+        def is_current(filename: str, digest: str) -> bool:
+            new_manifest[filename] = digest
+            return (old_manifest.get(filename) == digest
+                    and (output_dir / filename).exists())
 
-        # Save summary slide first
-        summary_svg = self.svg_renderer.render_summary(report)
-        summary_path = output_dir / "00_summary.svg"
-        summary_path.write_text(summary_svg, encoding="utf-8")
-        saved_files.append(summary_path)
-
-        # Save individual task slides
-        for i, task in enumerate(all_tasks, 1):
-            svg_content = self.svg_renderer.render_task(
-                task=task,
-                index=i,
-                total=total,
-                author=report.author,
-                week_string=report.week_string
+        staging_dir = Path(tempfile.mkdtemp(prefix=".staging-", dir=output_dir))
+        try:
+            logo_href = None
+            logo_written = 0
+            if shared_assets:
+                logo_data = self.svg_renderer.logo_bytes()
+                logo_href = self.svg_renderer.LOGO_FILENAME
+                logo_digest = hashlib.sha256(logo_data).hexdigest()
+                if not is_current(logo_href, logo_digest):
+                    (staging_dir / logo_href).write_bytes(logo_data)
+                    logo_written = len(logo_data)
+                    stats.bytes_written += logo_written
+
+            # Save summary slide first
+            summary_digest = self._slide_digest(
+                "summary",
+                len(report.accomplished),
+                len(report.in_progress),
+                len(report.blockers),
+                self.svg_renderer.top_topics(report),
+                report.author,
+                report.week_string,
+                logo_href
             )
+            if is_current("00_summary.svg", summary_digest):
+                stats.skipped += 1
+            else:
+                stats.rewritten += 1
+                summary_svg = self.svg_renderer.render_summary(report, logo_href=logo_href)
+                (staging_dir / "00_summary.svg").write_text(summary_svg, encoding="utf-8")
+                stats.bytes_written += len(summary_svg.encode("utf-8"))
+            saved_files.append(output_dir / "00_summary.svg")
+
+            # Save individual task slides, skipping those whose inputs are unchanged
+            slide_args = []
+            for i, task in enumerate(all_tasks, 1):
+                filename = self._slide_filename(i, task)
+                saved_files.append(output_dir / filename)
+                digest = self._slide_digest(
+                    task.to_dict(), i, total, report.author, report.week_string, logo_href
+                )
+                if is_current(filename, digest):
+                    stats.skipped += 1
+                    continue
+                stats.rewritten += 1
+                slide_args.append(
+                    (self.svg_renderer, staging_dir / filename, task, i, total,
+                     report.author, report.week_string, logo_href)
+                )
+
+            if jobs > 1 and len(slide_args) > 1:
+                sizes = self._write_slides_parallel(slide_args, jobs)
+            else:
+                sizes = [_write_task_slide(*args) for args in slide_args]
+            stats.bytes_written += sum(sizes)
 
-            # Create filename with topic
-            topic_slug = (task.topic or "general").lower().replace(" ", "_")[:20]
-            filename = f"{i:02d}_{topic_slug}.svg"
-            file_path = output_dir / filename
+            # Every slide rendered: move the staged files into place
+            for staged in staging_dir.iterdir():
+                os.replace(staged, output_dir / staged.name)
 
-            file_path.write_text(svg_content, encoding="utf-8")
-            saved_files.append(file_path)
+            # Drop slides from the previous run that are no longer produced
+            for filename in old_manifest.keys() - new_manifest.keys():
+                (output_dir / filename).unlink(missing_ok=True)
+
+            manifest_data = {
+                "renderer_version": self.svg_renderer.VERSION,
+                "slides": new_manifest
+            }
+            staged_manifest = staging_dir / self.MANIFEST_FILENAME
+            staged_manifest.write_text(json.dumps(manifest_data, indent=2), encoding="utf-8")
+            os.replace(staged_manifest, manifest_path)
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+
+        stats.slides = len(saved_files)
+        if shared_assets:
+            inline_size = len(self.svg_renderer.get_logo_href())
+            per_slide = inline_size - len(logo_href)
+            # Only slides written this run count; skipped ones cost no I/O either way
+            stats.bytes_saved = per_slide * stats.rewritten - logo_written
+        self.slide_stats = stats
 
         return saved_files
+
+    def _load_manifest(self, manifest_path: Path) -> dict[str, str]:
+        """Load slide hashes from a previous run, if still valid."""
+        try:
+            data = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if data.get("renderer_version") != self.svg_renderer.VERSION:
+            return {}
+        return data.get("slides", {})
+
+    def _slide_digest(self, *inputs) -> str:
+        """Hash the inputs that determine a slide's content."""
+        import hashlib
+
+        payload = json.dumps(
+            [self.svg_renderer.VERSION, *inputs], sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _slide_filename(self, index: int, task: Task) -> str:
+        """Build the ``NN_topic.svg`` filename for a task slide."""
+        topic_slug = (task.topic or "general").lower().replace(" ", "_")[:20]
+        return f"{index:02d}_{topic_slug}.svg"
+
+    def _write_slides_parallel(self, slide_args: list[tuple], jobs: int) -> list[int]:
+        """Render and write task slides across a process pool, in order."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(slide_args) // (jobs * 4))
+        executor = ProcessPoolExecutor(max_workers=jobs)
+        try:
+            return list(executor.map(_write_task_slide_args, slide_args, chunksize=chunksize))
+        except Exception as e:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise RuntimeError(f"SVG slide rendering failed: {e}") from e
+        finally:
+            executor.shutdown(wait=True)
+
+
+def _write_task_slide(
+    renderer: "SvgRenderer",
+    file_path: Path,
+    task: Task,
+    index: int,
+    total: int,
+    author: str,
+    week_string: str,
+    logo_href: Optional[str]
+) -> int:
+    """Render one task slide to a file and return the bytes written."""
+    svg_content = renderer.render_task(
+        task=task,
+        index=index,
+        total=total,
+        author=author,
+        week_string=week_string,
+        logo_href=logo_href
+    )
+    file_path.write_text(svg_content, encoding="utf-8")
+    return len(svg_content.encode("utf-8"))
+
+
+def _write_task_slide_args(args: tuple) -> int:
+    """Unpack a slide argument tuple for ``ProcessPoolExecutor.map``."""
+    return _write_task_slide(*args)
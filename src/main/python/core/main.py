@@ -1,12 +1,14 @@
 """CLI entry point for the status report generator."""
 
 import argparse
+import atexit
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
 from core.generator import ReportGenerator
-from models.report import Task, TaskStatus
+from models.report import Report, Task, TaskStatus
 
 
 def parse_date(date_str: str) -> datetime:
@@ -14,6 +16,198 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d")
 
 
+def parse_period(period: str) -> tuple[datetime, datetime]:
+    """Parse a ``--topic-trend`` period; the archive service is only imported when one is given."""
+    from services import archive_service
+
+    return archive_service.parse_period(period)
+
+
+def print_git_trace(generator: ReportGenerator) -> None:
+    """Print the git invocation log collected during the run."""
+    executor = generator.git_executor
+    print("\nGit commands:", file=sys.stderr)
+    for invocation in executor.invocations:
+        if invocation.timed_out:
+            status = "timeout"
+        elif invocation.cancelled:
+            status = "stopped"
+        else:
+            status = f"exit {invocation.returncode}"
+        print(f"  {invocation.duration * 1000:8.1f} ms  {status:<8} "
+              f"git {' '.join(invocation.args)[:80]}", file=sys.stderr)
+    stats = executor.stats()
+    print(f"  {stats['commands']} commands, {stats['failed']} failed, "
+          f"{stats['timed_out']} timed out, {stats['total_time'] * 1000:.1f} ms total",
+          file=sys.stderr)
+
+
+def print_stage_timings(generator: ReportGenerator, width: int = 40) -> None:
+    """Print when each input stage of the last report ran, as a timeline."""
+    timings = generator.stage_timings
+    if not timings:
+        return
+    total = max(timing.end for timing in timings)
+    scale = width / total if total > 0 else 0
+    print(f"\nStages ({total * 1000:.1f} ms):", file=sys.stderr)
+    for timing in sorted(timings, key=lambda t: t.start):
+        offset = int(timing.start * scale)
+        length = max(1, int(timing.end * scale) - offset)
+        bar = " " * offset + "#" * length
+        print(f"  {timing.name:<14} {timing.start * 1000:8.1f} - {timing.end * 1000:8.1f} ms  "
+              f"|{bar:<{width}}|", file=sys.stderr)
+
+
+def read_list_file(file_path: str) -> list[str]:
+    """Read non-empty, non-comment lines from a list file."""
+    entries = []
+    for line in Path(file_path).read_text(encoding="utf-8").split("\n"):
+        line = line.strip()
+        if line and not line.startswith("#"):
+            entries.append(line)
+    return entries
+
+
+def read_repo_manifest(manifest_path: str) -> list[str]:
+    """Read repository paths from a manifest file (one per line, # comments).
+
+    Relative paths are resolved against the manifest's directory.
+    """
+    manifest = Path(manifest_path)
+    return [
+        str(manifest.parent / Path(line).expanduser())
+        for line in read_list_file(manifest_path)
+    ]
+
+
+def author_slug(author: str) -> str:
+    """Build a filesystem-friendly slug from an author name."""
+    slug = "".join(c if c.isalnum() else "_" for c in author.lower()).strip("_")
+    return slug or "unknown"
+
+
+def run_team_batch(generator: ReportGenerator, args: argparse.Namespace) -> int:
+    """Generate and save one report per author (``--team`` mode)."""
+    members = None
+    if args.team_file:
+        members = read_list_file(args.team_file)
+
+    reports = generator.generate_team(
+        week_start=args.week_start,
+        week_end=args.week_end,
+        members=members
+    )
+
+    if args.archive:
+        from services.archive_service import ArchiveService
+
+        archive = ArchiveService(args.archive_db)
+        for report in reports:
+            archive.save_report(report)
+        archive.close()
+
+    output_dir = Path(args.output) if args.output else Path("output")
+
+    print(f"\n{'='*50}")
+    print("  TEAM REPORTS GENERATED")
+    print(f"{'='*50}\n")
+    for report in reports:
+        stem = f"{report.week_start.strftime('%Y%m%d')}_{author_slug(report.author)}"
+        if args.svg:
+            saved_files = generator.save_svg_slides(
+                report, output_dir / f"slides_{stem}",
+                shared_assets=args.shared_assets,
+                jobs=args.jobs,
+                incremental=not args.full_render
+            )
+            output_path = saved_files[0].parent
+        elif args.deck:
+            output_path = generator.save_deck(report, output_dir / f"status_deck_{stem}.html")
+        else:
+            output_path = generator.save_html(report, output_dir / f"status_report_{stem}.html")
+        print(f"  {report.author:<30} {len(report.accomplished):>5} items  {output_path}")
+
+    print(f"\n{len(reports)} reports for {reports[0].week_string if reports else 'this week'}")
+    print()
+    return 0
+
+
+def format_topics(report: Report, limit: int = 5) -> str:
+    """Summarize the report's most common topics, e.g. ``DVFS (4), Infra (2)``."""
+    topics = [(topic, count) for topic, count in report.topic_counts().items() if topic]
+    text = ", ".join(f"{topic} ({count})" for topic, count in topics[:limit])
+    if len(topics) > limit:
+        text += f", +{len(topics) - limit} more"
+    return text
+
+
+def run_archive_query(args: argparse.Namespace) -> int:
+    """Answer a trend query from the report archive, without git or task files."""
+    from services.archive_service import ArchiveService
+
+    archive = ArchiveService(args.archive_db)
+    start = time.perf_counter()
+    if args.stale_blockers is not None:
+        blockers = archive.stale_blockers(args.stale_blockers, author=args.author)
+        elapsed = time.perf_counter() - start
+        print(f"\nBlockers open more than {args.stale_blockers} weeks:\n")
+        for blocker in blockers:
+            topic = f"[{blocker.topic}] " if blocker.topic else ""
+            print(f"  {blocker.weeks_open:>3} wk  since {blocker.first_week}  "
+                  f"{blocker.author:<20} {topic}{blocker.title}")
+        count = len(blockers)
+    else:
+        since, until = args.topic_trend
+        rows = archive.topic_trend(since, until, author=args.author)
+        elapsed = time.perf_counter() - start
+        print(f"\nTasks per topic per week, {since:%Y-%m-%d} to {until:%Y-%m-%d}:\n")
+        week = None
+        for row in rows:
+            if row.week_start != week:
+                week = row.week_start
+                print(f"  Week of {week}")
+            print(f"    {row.tasks:>5}  {row.topic or '(no topic)'}")
+        count = len(rows)
+    archive.close()
+    print(f"\n{count} rows in {elapsed * 1000:.1f} ms")
+    return 0
+
+
+def run_watch(generator: ReportGenerator, args: argparse.Namespace, generate_kwargs: dict) -> int:
+    """Keep the report up to date as the task source changes (``--watch`` mode)."""
+    from core.watch import WatchSession
+    from utils.file_watcher import FileWatcher
+
+    session = WatchSession(
+        generator,
+        generate_kwargs,
+        output_path=args.output,
+        svg=args.svg,
+        deck=args.deck,
+        svg_kwargs=dict(shared_assets=args.shared_assets, jobs=args.jobs)
+    )
+    watcher = FileWatcher(session.watch_path, poll_interval=args.watch_interval)
+    print(f"Watching {session.watch_path} ({watcher.backend}), press Ctrl+C to stop")
+
+    try:
+        while True:
+            try:
+                update = session.refresh()
+            except Exception as e:
+                print(f"[{datetime.now():%H:%M:%S}] Error: {e}", file=sys.stderr)
+                update = None
+            if update is not None:
+                print(f"[{datetime.now():%H:%M:%S}] {', '.join(update.changed_sections)} changed: "
+                      f"{update.rendered} rendered, {update.written} written "
+                      f"in {update.duration * 1000:.0f} ms -> {session.saved_path}")
+            watcher.wait()
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+        return 0
+    finally:
+        watcher.close()
+
+
 def prompt_for_items(section_name: str) -> list[str]:
     """Prompt user to enter items for a section."""
     print(f"\n{'='*50}")
@@ -49,16 +243,91 @@ def main() -> int:
 Examples:
   %(prog)s                          Generate HTML report (default)
   %(prog)s --svg                    Generate SVG slides (chip floorplan style)
+  %(prog)s --svg --shared-assets    SVG slides sharing one copy of the logo
+  %(prog)s --deck                   Generate a single-file HTML slide deck
+  %(prog)s --svg --jobs 8           Render SVG slides with 8 worker processes
   %(prog)s --no-interactive         Skip prompts, read from tasks.txt only
   %(prog)s -o my_report.html        Save to specific file
+  %(prog)s --task-file 'daily/*_task.txt'
+                                    Read this week's daily task files
+  %(prog)s --journal weeky_task_status.txt
+                                    Use this week's dated entries from a journal
+  %(prog)s --from-git -r a -r b     Aggregate commits from several repositories
+  %(prog)s --save-snapshot          Also save the report for later re-rendering
+  %(prog)s --archive                Also store the report in the SQLite archive
+  %(prog)s --svg --watch            Re-render changed slides whenever tasks.txt is saved
+  %(prog)s --stale-blockers 2       Archived blockers open more than 2 weeks
+  %(prog)s --topic-trend 2026Q3     Archived tasks per topic per week for Q3
+  %(prog)s --svg --from-snapshot output/status_report_20260112.snap
+                                    Re-render a saved report as SVG slides
+  %(prog)s --team -o team_reports   One report per author from a single git log pass
         """
     )
 
     parser.add_argument(
         "-r", "--repo",
-        help="Path to Git repository (default: current directory)",
+        action="append",
+        dest="repos",
+        help="Path to Git repository (default: current directory; can be used multiple times)",
         default=None
     )
+    parser.add_argument(
+        "--repo-manifest",
+        help="File listing Git repository paths, one per line",
+        default=None
+    )
+    parser.add_argument(
+        "--git-jobs",
+        type=int,
+        default=4,
+        help="Maximum number of concurrent git processes (default: 4)"
+    )
+    parser.add_argument(
+        "--git-timeout",
+        type=float,
+        default=60.0,
+        help="Timeout in seconds for each git command (default: 60)"
+    )
+    parser.add_argument(
+        "--git-trace",
+        action="store_true",
+        help="Print the duration and exit status of every git command to stderr"
+    )
+    parser.add_argument(
+        "--branches",
+        action="store_true",
+        help="Add your branches with commits this week as in-progress items"
+    )
+    parser.add_argument(
+        "--remote-branches",
+        action="store_true",
+        help="With --branches, also scan remote-tracking branches"
+    )
+    parser.add_argument(
+        "--team",
+        action="store_true",
+        help="Batch mode: one Git-based report per author from a single git log pass"
+    )
+    parser.add_argument(
+        "--team-file",
+        help="With --team, only report on the authors (names or emails) listed in this file",
+        default=None
+    )
+    parser.add_argument(
+        "--task-file",
+        help="Task file, or a directory or glob of daily YYYYMMDD_task.txt files (default: tasks.txt)",
+        default=None
+    )
+    parser.add_argument(
+        "--journal",
+        help="Read this week's entries from a journal of 'YYYYMMDD - task' lines",
+        default=None
+    )
+    parser.add_argument(
+        "--from-git",
+        action="store_true",
+        help="Build the report from Git commits even if tasks.txt exists"
+    )
     parser.add_argument(
         "-o", "--output",
         help="Output path (file for HTML, directory for SVG)",
@@ -105,6 +374,111 @@ Examples:
         action="store_true",
         help="Generate SVG slides instead of HTML (chip floorplan style)"
     )
+    parser.add_argument(
+        "--deck",
+        action="store_true",
+        help="Generate a single-file HTML slide deck of the SVG slides"
+    )
+    parser.add_argument(
+        "--shared-assets",
+        action="store_true",
+        help="Write the logo once as a sidecar file referenced by every SVG slide"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for rendering SVG slides (default: 1)"
+    )
+    parser.add_argument(
+        "--full-render",
+        action="store_true",
+        help="Re-render every SVG slide, ignoring the slide manifest"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or update the persistent caches in output/.cache"
+    )
+    parser.add_argument(
+        "--save-snapshot",
+        nargs="?",
+        const="",
+        metavar="FILE",
+        help="Also save the report as a binary snapshot (default: output/status_report_<week>.snap)",
+        default=None
+    )
+    parser.add_argument(
+        "--from-snapshot",
+        metavar="FILE",
+        help="Re-render a report saved with --save-snapshot instead of reading tasks or Git",
+        default=None
+    )
+    parser.add_argument(
+        "--archive",
+        action="store_true",
+        help="Store the generated report(s) in the SQLite report archive"
+    )
+    parser.add_argument(
+        "--archive-db",
+        help="Report archive database (default: output/archive.db)",
+        default=None
+    )
+    parser.add_argument(
+        "--stale-blockers",
+        type=int,
+        metavar="WEEKS",
+        help="Query the archive for blockers open more than WEEKS weeks, then exit",
+        default=None
+    )
+    parser.add_argument(
+        "--topic-trend",
+        type=parse_period,
+        metavar="PERIOD",
+        help="Query the archive for tasks per topic per week in PERIOD "
+             "(2026Q3, 2026 or 2026-07-01:2026-09-30), then exit",
+        default=None
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and re-render whenever the task file changes"
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=1.0,
+        help="Polling interval in seconds when inotify is unavailable (default: 1)"
+    )
+    parser.add_argument(
+        "--serve",
+        type=int,
+        nargs="?",
+        const=8000,
+        metavar="PORT",
+        help="Serve reports for any author and week over HTTP (default port: 8000)",
+        default=None
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address for --serve to listen on (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Look up the author, read the task file and fetch commits at the same time"
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print when each input stage ran (to stderr)"
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Store tasks in compact columnar form (for very large Git-based reports)"
+    )
     parser.add_argument(
         "--print",
         action="store_true",
@@ -113,22 +487,57 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.serve is not None and (args.watch or args.print_html or args.team or args.from_snapshot):
+        parser.error("--serve cannot be combined with --watch, --print, --team or --from-snapshot")
+    if args.watch and (args.print_html or args.team or args.from_git or args.from_snapshot):
+        parser.error("--watch cannot be combined with --print, --team, --from-git or --from-snapshot")
 
     try:
+        if args.stale_blockers is not None or args.topic_trend is not None:
+            return run_archive_query(args)
+
         # Initialize generator
-        generator = ReportGenerator(repo_path=args.repo)
+        repo_paths = list(args.repos or [])
+        if args.repo_manifest:
+            repo_paths.extend(read_repo_manifest(args.repo_manifest))
+
+        generator = ReportGenerator(
+            repo_paths=repo_paths or None,
+            cache_dir=None if args.no_cache else ReportGenerator.DEFAULT_CACHE_DIR,
+            git_jobs=args.git_jobs,
+            git_timeout=args.git_timeout,
+            task_file=args.task_file,
+            journal_file=args.journal
+        )
+        if args.git_trace:
+            atexit.register(print_git_trace, generator)
+
+        if args.team:
+            return run_team_batch(generator, args)
+
+        if args.serve is not None:
+            from api.server import serve
+            serve(generator, host=args.host, port=args.serve,
+                  use_task_file=not args.from_git, verbose=True)
+            return 0
 
         # Collect in-progress items and blockers
         in_progress_items = args.in_progress or []
         blocker_items = args.blockers or []
 
-        # Interactive mode (only for non-SVG, non-print modes)
-        if not args.no_interactive and not args.print_html and not args.svg:
+        # Interactive mode (only for HTML report mode)
+        if (not args.no_interactive and not args.print_html and not args.svg and not args.deck
+                and not args.from_snapshot):
             print("\n" + "="*50)
             print("  WEEKLY STATUS REPORT GENERATOR")
             print("="*50)
 
-            print("\nTasks will be read from tasks.txt")
+            if args.from_git:
+                print("\nTasks will be read from Git commits")
+            elif args.journal:
+                print(f"\nTasks will be read from {args.journal}")
+            else:
+                print(f"\nTasks will be read from {args.task_file or 'tasks.txt'}")
 
             # Prompt for In Progress
             in_progress_input = prompt_for_items("In Progress")
@@ -138,35 +547,87 @@ Examples:
             blocker_input = prompt_for_items("Blockers")
             blocker_items.extend(blocker_input)
 
-        # Generate report
-        report = generator.generate(
+        generate_kwargs = dict(
             week_start=args.week_start,
             week_end=args.week_end,
             author=args.author,
             blockers=blocker_items if blocker_items else None,
-            in_progress=in_progress_items if in_progress_items else None
+            in_progress=in_progress_items if in_progress_items else None,
+            use_task_file=not args.from_git,
+            include_branches=args.branches or args.remote_branches,
+            include_remote_branches=args.remote_branches,
+            compact=args.compact,
+            concurrent=args.concurrent
         )
 
+        if args.watch:
+            return run_watch(generator, args, generate_kwargs)
+
+        # Generate report, or load a saved one
+        if args.from_snapshot:
+            report = generator.load_snapshot(args.from_snapshot, compact=args.compact)
+        else:
+            report = generator.generate(**generate_kwargs)
+            if args.timings:
+                print_stage_timings(generator)
+
+        if args.archive:
+            from services.archive_service import ArchiveService
+
+            archive = ArchiveService(args.archive_db)
+            archive.save_report(report)
+            archive.close()
+
+        if args.save_snapshot is not None:
+            snapshot_path = generator.save_snapshot(report, args.save_snapshot or None)
+            print(f"Snapshot saved to {snapshot_path}", file=sys.stderr)
+
         # Output
         if args.print_html:
-            html = generator.render_html(report)
-            print(html)
+            generator.write_html(report, sys.stdout)
+            print()
         elif args.svg:
             # Generate SVG slides
-            saved_files = generator.save_svg_slides(report, args.output)
+            saved_files = generator.save_svg_slides(
+                report, args.output,
+                shared_assets=args.shared_assets,
+                jobs=args.jobs,
+                incremental=not args.full_render
+            )
 
             print(f"\n{'='*60}")
             print("  SVG SLIDES GENERATED - CHIP FLOORPLAN STYLE")
             print(f"{'='*60}")
             print(f"\nOutput directory: {saved_files[0].parent.absolute()}")
-            print(f"\nGenerated {len(saved_files)} slides:")
+            stats = generator.slide_stats
+            print(f"\nGenerated {len(saved_files)} slides "
+                  f"({stats.rewritten} rewritten, {stats.skipped} unchanged):")
             for f in saved_files:
                 print(f"  - {f.name}")
             print(f"\nWeekly Status Report - {report.week_string}")
             print(f"Author: {report.author}")
-            print(f"\n  Accomplished:  {len(report.accomplished.tasks)} slides")
-            print(f"  In Progress:   {len(report.in_progress.tasks)} slides")
-            print(f"  Blockers:      {len(report.blockers.tasks)} slides")
+            print(f"\n  Accomplished:  {len(report.accomplished)} slides")
+            print(f"  In Progress:   {len(report.in_progress)} slides")
+            print(f"  Blockers:      {len(report.blockers)} slides")
+            topics = format_topics(report)
+            if topics:
+                print(f"  Topics:        {topics}")
+            if args.shared_assets:
+                print(f"\n  Shared assets: {stats.bytes_written:,} bytes written, "
+                      f"{stats.bytes_saved:,} bytes saved")
+            print()
+        elif args.deck:
+            output_path = generator.save_deck(report, args.output)
+            slide_count = report.task_count + 1
+
+            print(f"\n{'='*50}")
+            print("  SLIDE DECK GENERATED")
+            print(f"{'='*50}")
+            print(f"\nFile: {output_path.absolute()}")
+            print(f"\nWeekly Status Report - {report.week_string}")
+            print(f"Author: {report.author}")
+            print(f"\n  Slides:        {slide_count}")
+            print(f"  Size:          {output_path.stat().st_size:,} bytes")
             print()
         else:
             output_path = generator.save_html(report, args.output)
@@ -177,9 +638,12 @@ Examples:
             print(f"\nFile: {output_path.absolute()}")
             print(f"\nWeekly Status Report - {report.week_string}")
             print(f"Author: {report.author}")
-            print(f"\n  Accomplished:  {len(report.accomplished.tasks)} items")
-            print(f"  In Progress:   {len(report.in_progress.tasks)} items")
-            print(f"  Blockers:      {len(report.blockers.tasks)} items")
+            print(f"\n  Accomplished:  {len(report.accomplished)} items")
+            print(f"  In Progress:   {len(report.in_progress)} items")
+            print(f"  Blockers:      {len(report.blockers)} items")
+            topics = format_topics(report)
+            if topics:
+                print(f"  Topics:        {topics}")
             print()
 
         return 0
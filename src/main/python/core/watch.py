@@ -0,0 +1,133 @@
+"""Watch mode: regenerate a report whenever its task source changes."""
+
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from core.generator import ReportGenerator
+from models.report import Report
+
+
+@dataclass
+class WatchUpdate:
+    """What one refresh of a watched report changed."""
+    changed_sections: list[str] = field(default_factory=list)
+    rendered: int = 0
+    written: int = 0
+    duration: float = 0.0
+
+
+class WatchSession:
+    """Keeps the last report and its rendered parts between refreshes.
+
+    Each refresh re-reads the task source and compares the new sections with
+    the previous report. Nothing is rendered if no section changed. For HTML,
+    only changed sections are re-rendered and the rest is reused. For SVG,
+    the slide manifest limits rendering and writing to the slides that
+    differ.
+    """
+
+    def __init__(
+        self,
+        generator: ReportGenerator,
+        generate_kwargs: dict,
+        output_path: Optional[str] = None,
+        svg: bool = False,
+        deck: bool = False,
+        svg_kwargs: Optional[dict] = None
+    ):
+        self.generator = generator
+        self.generate_kwargs = dict(generate_kwargs)
+        self.output_path = output_path
+        self.svg = svg
+        self.deck = deck
+        self.svg_kwargs = svg_kwargs or {}
+        self.report: Optional[Report] = None
+        self.saved_path: Optional[Path] = None
+        self._rendered_sections: dict[str, str] = {}
+
+    @property
+    def watch_path(self) -> Path:
+        """The file or directory whose changes should trigger a refresh."""
+        if self.generator.journal_service:
+            return self.generator.journal_service.file_path
+        task_file_service = self.generator.task_file_service
+        path = task_file_service.file_path
+        if task_file_service.is_daily and not path.is_dir():
+            return path.parent
+        return path
+
+    def source_exists(self) -> bool:
+        if self.generator.journal_service:
+            return self.generator.journal_service.file_exists()
+        return self.generator.task_file_service.file_exists()
+
+    def refresh(self) -> Optional[WatchUpdate]:
+        """Regenerate the report and re-render what changed.
+
+        Returns None if the task source is missing (e.g. mid-save) or no
+        section changed.
+        """
+        if not self.source_exists():
+            return None
+        start = time.perf_counter()
+        report = self.generator.generate(**self.generate_kwargs)
+        # The author is looked up once; later refreshes do not need git
+        self.generate_kwargs["author"] = report.author
+
+        changed = self._changed_sections(report)
+        if self.report is not None and not changed:
+            return None
+        self.report = report
+
+        update = WatchUpdate(changed_sections=changed)
+        if self.svg:
+            saved_files = self.generator.save_svg_slides(report, self.output_path, **self.svg_kwargs)
+            self.saved_path = saved_files[0].parent
+            update.rendered = self.generator.slide_stats.rewritten
+            update.written = self.generator.slide_stats.rewritten
+        elif self.deck:
+            self.saved_path = self.generator.save_deck(report, self.output_path)
+            update.rendered = report.task_count + 1
+            update.written = 1
+        else:
+            self._save_html(report, changed)
+            update.rendered = len(changed)
+            update.written = 1
+        update.duration = time.perf_counter() - start
+        return update
+
+    def _changed_sections(self, report: Report) -> list[str]:
+        """Keys of the sections that differ from the previous report."""
+        previous = self.report
+        if (previous is None or previous.author != report.author
+                or previous.week_string != report.week_string):
+            return list(report.SECTION_KEYS)
+        return [
+            key for key, old, new in zip(report.SECTION_KEYS, previous.sections, report.sections)
+            if len(old) != len(new) or list(old.tasks) != list(new.tasks)
+        ]
+
+    def _save_html(self, report: Report, changed: list[str]) -> None:
+        """Re-render the changed sections and atomically replace the HTML file."""
+        renderer = self.generator.html_renderer
+        for key, section in zip(report.SECTION_KEYS, report.sections):
+            if key in changed or key not in self._rendered_sections:
+                self._rendered_sections[key] = renderer.render_section(section)
+
+        if self.output_path is None:
+            filename = f"status_report_{report.week_start.strftime('%Y%m%d')}.html"
+            output_path = Path("output") / filename
+        else:
+            output_path = Path(self.output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Written next to the target and renamed, so a browser reload never sees half a file
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for chunk in renderer.iter_render(report, self._rendered_sections):
+                f.write(chunk)
+        os.replace(tmp_path, output_path)
+        self.saved_path = output_path
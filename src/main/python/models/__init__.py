@@ -1,5 +1,25 @@
 """Data models for status reports."""
 
-from .report import Report, Section, Task, TaskStatus
+from importlib import import_module
 
-__all__ = ["Report", "Section", "Task", "TaskStatus"]
+__all__ = [
+    "CommitRecord", "Report", "Section", "SnapshotError", "Task", "TaskStatus", "TaskTable"
+]
+
+# Exported names and their modules. Loaded on first access, so importing
+# one model does not import the others.
+_EXPORTS = {
+    "CommitRecord": "commit",
+    "Report": "report",
+    "Section": "report",
+    "SnapshotError": "snapshot",
+    "Task": "report",
+    "TaskStatus": "report",
+    "TaskTable": "task_table",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
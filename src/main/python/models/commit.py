@@ -0,0 +1,26 @@
+"""Data model for commits read from Git history."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from .report import Task, TaskStatus
+
+
+@dataclass(frozen=True)
+class CommitRecord:
+    """A commit as read from git log, before it is turned into a Task."""
+    hash: str
+    subject: str
+    author_name: str
+    author_email: str
+    author_date: Optional[datetime]
+    commit_time: int
+
+    def to_task(self) -> Task:
+        return Task(
+            title=self.subject,
+            commit_hash=self.hash[:7],
+            status=TaskStatus.COMPLETED,
+            date=self.author_date
+        )
@@ -1,8 +1,9 @@
 """Data models for weekly status reports."""
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Iterator, Optional
 from enum import Enum
 
 
@@ -13,7 +14,7 @@ class TaskStatus(Enum):
     BLOCKED = "blocked"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents a single task or work item."""
     title: str
@@ -23,6 +24,7 @@ class Task:
     commit_hash: Optional[str] = None
     pr_number: Optional[int] = None
     date: Optional[datetime] = None
+    repo: Optional[str] = None
 
     def to_dict(self) -> dict:
         return {
@@ -32,18 +34,126 @@ class Task:
             "status": self.status.value,
             "commit_hash": self.commit_hash,
             "pr_number": self.pr_number,
-            "date": self.date.isoformat() if self.date else None
+            "date": self.date.isoformat() if self.date else None,
+            "repo": self.repo
         }
 
 
+def _date_key(date: datetime) -> datetime:
+    """Order naive and aware datetimes together, as local wall-clock time."""
+    if date.tzinfo is not None:
+        return date.astimezone().replace(tzinfo=None)
+    return date
+
+
 @dataclass
 class Section:
-    """A section in the status report."""
+    """A section in the status report.
+
+    Tasks added with ``add_task`` are also recorded in a topic index, per-status
+    counts and the section's date range, so summaries and topic groupings do
+    not rescan every task.
+    """
     name: str
     tasks: list[Task] = field(default_factory=list)
+    _topic_rows: dict[Optional[str], array] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _status_counts: dict[TaskStatus, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _date_range: Optional[tuple[datetime, datetime]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed: int = field(default=0, init=False, repr=False, compare=False)
+    _indexed_tasks: Optional[object] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._sync()
+
+    def __len__(self) -> int:
+        return len(self.tasks)
 
     def add_task(self, task: Task) -> None:
+        self._sync()
         self.tasks.append(task)
+        self._index(len(self.tasks) - 1, task)
+
+    def compact(self) -> None:
+        """Move the tasks into a columnar TaskTable; later tasks are appended to it."""
+        from .task_table import TaskTable
+
+        if not isinstance(self.tasks, TaskTable):
+            self._sync()
+            self.tasks = TaskTable(self.tasks)
+            # Same tasks in the same order, so the indexes stay valid
+            self._indexed_tasks = self.tasks
+
+    def _sync(self) -> None:
+        """Bring the indexes up to date with ``tasks``.
+
+        Tasks appended to the list directly are indexed from where indexing
+        stopped; a replaced or shortened list is reindexed from scratch.
+        """
+        if self._indexed_tasks is not self.tasks or self._indexed > len(self.tasks):
+            self._topic_rows = {}
+            self._status_counts = {}
+            self._date_range = None
+            self._indexed = 0
+            self._indexed_tasks = self.tasks
+        if self._indexed < len(self.tasks):
+            for row in range(self._indexed, len(self.tasks)):
+                self._index(row, self.tasks[row])
+
+    def _index(self, row: int, task: Task) -> None:
+        """Record one task in the topic, status and date indexes."""
+        rows = self._topic_rows.get(task.topic)
+        if rows is None:
+            rows = self._topic_rows[task.topic] = array("I")
+        rows.append(row)
+        self._status_counts[task.status] = self._status_counts.get(task.status, 0) + 1
+        if task.date is not None:
+            if self._date_range is None:
+                self._date_range = (task.date, task.date)
+            else:
+                first, last = self._date_range
+                self._date_range = (min(first, task.date, key=_date_key),
+                                    max(last, task.date, key=_date_key))
+        self._indexed = row + 1
+
+    @property
+    def status_counts(self) -> dict[TaskStatus, int]:
+        """Number of tasks per status."""
+        self._sync()
+        return dict(self._status_counts)
+
+    @property
+    def date_range(self) -> Optional[tuple[datetime, datetime]]:
+        """Earliest and latest task date, or None if no task is dated."""
+        self._sync()
+        return self._date_range
+
+    @property
+    def topics(self) -> list[Optional[str]]:
+        """Topics in order of first appearance (None for untagged tasks)."""
+        self._sync()
+        return list(self._topic_rows)
+
+    def topic_counts(self) -> dict[Optional[str], int]:
+        """Number of tasks per topic, in order of first appearance."""
+        self._sync()
+        return {topic: len(rows) for topic, rows in self._topic_rows.items()}
+
+    def tasks_for_topic(self, topic: Optional[str]) -> list[Task]:
+        """Tasks with the given topic, in the order they were added."""
+        self._sync()
+        return [self.tasks[row] for row in self._topic_rows.get(topic, ())]
+
+    def group_by_topic(self) -> Iterator[tuple[Optional[str], list[Task]]]:
+        """Yield ``(topic, tasks)`` groups in order of first appearance."""
+        self._sync()
+        for topic, rows in list(self._topic_rows.items()):
+            yield topic, [self.tasks[row] for row in rows]
 
     def to_dict(self) -> dict:
         return {
@@ -63,10 +173,56 @@ class Report:
     blockers: Section = field(default_factory=lambda: Section("Blockers"))
     generated_at: datetime = field(default_factory=datetime.now)
 
+    # Keys of the sections, in the order of ``sections`` (as used in task files)
+    SECTION_KEYS: ClassVar[tuple[str, str, str]] = ("accomplished", "in_progress", "blockers")
+
+    @property
+    def sections(self) -> tuple[Section, Section, Section]:
+        return (self.accomplished, self.in_progress, self.blockers)
+
+    @property
+    def task_count(self) -> int:
+        return sum(len(section) for section in self.sections)
+
+    def compact(self) -> "Report":
+        """Store every section's tasks in compact columnar form."""
+        for section in self.sections:
+            section.compact()
+        return self
+
+    def topic_counts(self) -> dict[Optional[str], int]:
+        """Number of tasks per topic across all sections, most common first."""
+        counts: dict[Optional[str], int] = {}
+        for section in self.sections:
+            for topic, count in section.topic_counts().items():
+                counts[topic] = counts.get(topic, 0) + count
+        return dict(sorted(counts.items(), key=lambda item: -item[1]))
+
+    def status_counts(self) -> dict[TaskStatus, int]:
+        """Number of tasks per status across all sections."""
+        counts = {status: 0 for status in TaskStatus}
+        for section in self.sections:
+            for status, count in section.status_counts.items():
+                counts[status] += count
+        return counts
+
     @property
     def week_string(self) -> str:
         return f"{self.week_start.strftime('%b %d')} - {self.week_end.strftime('%b %d, %Y')}"
 
+    def to_snapshot(self) -> bytes:
+        """Serialize the report to the compact binary snapshot format."""
+        from .snapshot import dump_snapshot
+
+        return dump_snapshot(self)
+
+    @classmethod
+    def from_snapshot(cls, data: bytes, compact: bool = False) -> "Report":
+        """Load a report saved with ``to_snapshot``."""
+        from .snapshot import load_snapshot
+
+        return load_snapshot(data, compact=compact)
+
     def to_dict(self) -> dict:
         return {
             "author": self.author,
@@ -0,0 +1,193 @@
+"""Compact, versioned binary snapshots of reports."""
+
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Optional
+
+from .report import Report, Task, TaskStatus
+
+
+MAGIC = b"SRSN"
+VERSION = 1
+
+# Magic, format version, string count, string blob size, task counts per section
+_HEADER = struct.Struct("<4sHIQ3I")
+# String ids of author and section names, then week start/end and generated_at
+_REPORT = struct.Struct("<4I3q3i")
+# Per-section columns: title, topic, description, hash and repo string ids,
+# status code, PR number, date and UTC offset
+_COLUMN_TYPES = "IIIIIBqqi"
+
+_STATUSES = tuple(TaskStatus)
+# Datetimes are stored as wall-clock microseconds since this epoch plus a UTC offset
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_SECOND = timedelta(seconds=1)
+_NO_DATE = -(2 ** 63)
+_NO_OFFSET = -(2 ** 31)
+
+
+class SnapshotError(ValueError):
+    """Raised when snapshot data is truncated, corrupt or of another version."""
+
+
+def dump_snapshot(report: Report) -> bytes:
+    """Serialize a report to snapshot bytes.
+
+    Layout (little-endian): a header, one array per column for every
+    section (string ids, status codes, PR numbers, dates), a table of string
+    lengths and finally all distinct strings as one UTF-8 blob. Every string
+    (titles, topics, hashes, ...) is stored once and referenced by id, with
+    id 0 meaning None.
+    """
+    # Insertion-ordered, so the keys double as the string table
+    string_ids: dict[Optional[str], int] = {None: 0}
+    intern = string_ids.setdefault
+    status_codes = {status: code for code, status in enumerate(_STATUSES)}
+
+    author_id = intern(report.author, len(string_ids))
+    name_ids = [intern(section.name, len(string_ids)) for section in report.sections]
+    dates = [_encode_date(d) for d in (report.week_start, report.week_end, report.generated_at)]
+
+    columns = []
+    for section in report.sections:
+        tasks = list(section.tasks)
+        encoded_dates = [_encode_date(t.date) for t in tasks]
+        columns.extend((
+            array("I", [intern(t.title, len(string_ids)) for t in tasks]),
+            array("I", [intern(t.topic, len(string_ids)) for t in tasks]),
+            array("I", [intern(t.description, len(string_ids)) for t in tasks]),
+            array("I", [intern(t.commit_hash, len(string_ids)) for t in tasks]),
+            array("I", [intern(t.repo, len(string_ids)) for t in tasks]),
+            array("B", [status_codes[t.status] for t in tasks]),
+            array("q", [-1 if t.pr_number is None else t.pr_number for t in tasks]),
+            array("q", [micros for micros, _ in encoded_dates]),
+            array("i", [offset for _, offset in encoded_dates])
+        ))
+
+    strings = list(string_ids)[1:]
+    # Lengths are in characters, so loading decodes the blob in a single call
+    lengths = array("I", map(len, strings))
+    blob = "".join(strings).encode("utf-8")
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, len(strings), len(blob),
+                     *(len(section.tasks) for section in report.sections)),
+        _REPORT.pack(author_id, *name_ids,
+                     *(micros for micros, _ in dates), *(offset for _, offset in dates))
+    ]
+    parts.extend(_array_bytes(column) for column in columns)
+    parts.append(_array_bytes(lengths))
+    parts.append(blob)
+    return b"".join(parts)
+
+
+def load_snapshot(data: bytes, compact: bool = False) -> Report:
+    """Rebuild a report from snapshot bytes.
+
+    With ``compact``, sections are loaded into TaskTables.
+    Raises SnapshotError if the data is not a readable snapshot.
+    """
+    view = memoryview(data)
+    try:
+        magic, version, string_count, blob_size, *task_counts = _HEADER.unpack_from(view, 0)
+        if magic != MAGIC:
+            raise SnapshotError("not a report snapshot")
+        if version != VERSION:
+            raise SnapshotError(f"unsupported snapshot version {version}")
+        fields = _REPORT.unpack_from(view, _HEADER.size)
+    except struct.error as e:
+        raise SnapshotError(f"truncated snapshot: {e}") from None
+    position = _HEADER.size + _REPORT.size
+
+    def read_array(typecode: str, count: int) -> array:
+        nonlocal position
+        column = array(typecode)
+        size = column.itemsize * count
+        if position + size > len(view):
+            raise SnapshotError("truncated snapshot")
+        column.frombytes(view[position:position + size])
+        if sys.byteorder == "big":
+            column.byteswap()
+        position += size
+        return column
+
+    sections_columns = [
+        [read_array(typecode, count) for typecode in _COLUMN_TYPES]
+        for count in task_counts
+    ]
+    lengths = read_array("I", string_count)
+    if position + blob_size != len(view):
+        raise SnapshotError("truncated snapshot")
+
+    try:
+        text = str(view[position:], "utf-8")
+        ends = list(accumulate(lengths))
+        if (ends[-1] if ends else 0) != len(text):
+            raise SnapshotError("corrupt snapshot: string table does not match")
+        strings: list[Optional[str]] = [None]
+        strings.extend(map(text.__getitem__, map(slice, [0, *ends], ends)))
+
+        author_id, *name_ids = fields[:4]
+        week_start, week_end, generated_at = (
+            _decode_date(micros, offset) for micros, offset in zip(fields[4:7], fields[7:10])
+        )
+        report = Report(
+            author=strings[author_id],
+            week_start=week_start,
+            week_end=week_end,
+            generated_at=generated_at
+        )
+        for section, name_id, columns in zip(report.sections, name_ids, sections_columns):
+            section.name = strings[name_id]
+            if compact:
+                section.compact()
+            # Appended in one go; the section indexes them on first use
+            section.tasks.extend(
+                Task(
+                    strings[title],
+                    strings[topic],
+                    strings[description],
+                    _STATUSES[status],
+                    strings[commit_hash],
+                    None if pr_number == -1 else pr_number,
+                    _decode_date(micros, offset),
+                    strings[repo]
+                )
+                for title, topic, description, commit_hash, repo, status, pr_number, micros, offset
+                in zip(*columns)
+            )
+    except (IndexError, OverflowError, UnicodeDecodeError) as e:
+        raise SnapshotError(f"corrupt snapshot: {e}") from None
+    return report
+
+
+def _array_bytes(column: array) -> bytes:
+    """Get an array's contents in little-endian byte order."""
+    if sys.byteorder == "big":
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _encode_date(date: Optional[datetime]) -> tuple[int, int]:
+    """Encode a datetime as wall-clock microseconds and a UTC offset in seconds."""
+    if date is None:
+        return _NO_DATE, _NO_OFFSET
+    offset = date.utcoffset()
+    if offset is None:
+        return (date - _EPOCH) // _MICROSECOND, _NO_OFFSET
+    return (date.replace(tzinfo=None) - _EPOCH) // _MICROSECOND, offset // _SECOND
+
+
+def _decode_date(micros: int, offset: int) -> Optional[datetime]:
+    """Decode a datetime written by ``_encode_date``."""
+    if micros == _NO_DATE:
+        return None
+    date = _EPOCH + micros * _MICROSECOND
+    if offset != _NO_OFFSET:
+        date = date.replace(tzinfo=timezone(timedelta(seconds=offset)))
+    return date
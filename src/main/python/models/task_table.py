@@ -0,0 +1,144 @@
+"""Columnar storage for very large task lists."""
+
+from array import array
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Optional, Union
+
+from .report import Task, TaskStatus
+
+
+class TaskTable(Sequence):
+    """A compact, append-only sequence of tasks stored column by column.
+
+    Titles are kept as one UTF-8 buffer with offsets, topics and repos as
+    codes into an interned string table, statuses as small ints, short hex
+    commit hashes as packed integers and dates as epoch seconds. Rare values
+    (descriptions, long or non-hex hashes, timezone-aware dates) are kept in
+    side tables. Indexing and iteration build each ``Task`` on demand, so a
+    table can stand in for ``Section.tasks`` without holding one object per
+    task.
+    """
+
+    STATUSES = tuple(TaskStatus)
+    # Naive datetimes are stored as seconds since this wall-clock epoch
+    EPOCH = datetime(1970, 1, 1)
+    NO_DATE = -(2 ** 63)
+    # Hex hashes up to this many digits are packed into a 64-bit integer
+    MAX_PACKED_HASH = 16
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        self._title_data = bytearray()
+        self._title_ends = array("Q")
+        self._strings: list[Optional[str]] = [None]
+        self._string_codes: dict[str, int] = {}
+        self._topics = array("I")
+        self._repos = array("I")
+        self._statuses = array("B")
+        self._hashes = array("Q")
+        self._hash_lengths = array("B")
+        self._dates = array("q")
+        self._pr_numbers = array("q")
+        self._descriptions: dict[int, str] = {}
+        self._extra_hashes: dict[int, str] = {}
+        self._extra_dates: dict[int, datetime] = {}
+        self.extend(tasks)
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Task, list[Task]]:
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("task index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[Task]:
+        for i in range(len(self)):
+            yield self._row(i)
+
+    def append(self, task: Task) -> None:
+        """Add a task as a new row."""
+        row = len(self)
+        self._title_data += task.title.encode("utf-8")
+        self._title_ends.append(len(self._title_data))
+        self._topics.append(self._intern(task.topic))
+        self._repos.append(self._intern(task.repo))
+        self._statuses.append(self.STATUSES.index(task.status))
+        self._pr_numbers.append(-1 if task.pr_number is None else task.pr_number)
+        if task.description is not None:
+            self._descriptions[row] = task.description
+
+        commit_hash = task.commit_hash
+        if commit_hash is None:
+            self._hashes.append(0)
+            self._hash_lengths.append(0)
+        elif len(commit_hash) <= self.MAX_PACKED_HASH and _is_lower_hex(commit_hash):
+            self._hashes.append(int(commit_hash, 16))
+            self._hash_lengths.append(len(commit_hash))
+        else:
+            self._hashes.append(0)
+            self._hash_lengths.append(0)
+            self._extra_hashes[row] = commit_hash
+
+        date = task.date
+        if date is None:
+            self._dates.append(self.NO_DATE)
+        elif date.tzinfo is None and not date.microsecond:
+            self._dates.append((date - self.EPOCH) // timedelta(seconds=1))
+        else:
+            self._dates.append(self.NO_DATE)
+            self._extra_dates[row] = date
+
+    def extend(self, tasks: Iterable[Task]) -> None:
+        """Add several tasks."""
+        for task in tasks:
+            self.append(task)
+
+    def _intern(self, value: Optional[str]) -> int:
+        """Get the string-table code of a value, adding it if needed."""
+        if value is None:
+            return 0
+        code = self._string_codes.get(value)
+        if code is None:
+            code = len(self._strings)
+            self._strings.append(value)
+            self._string_codes[value] = code
+        return code
+
+    def _row(self, i: int) -> Task:
+        """Build the Task stored in row ``i``."""
+        start = self._title_ends[i - 1] if i else 0
+        title = self._title_data[start:self._title_ends[i]].decode("utf-8")
+
+        hash_length = self._hash_lengths[i]
+        if hash_length:
+            commit_hash = format(self._hashes[i], f"0{hash_length}x")
+        else:
+            commit_hash = self._extra_hashes.get(i)
+
+        seconds = self._dates[i]
+        if seconds != self.NO_DATE:
+            date = self.EPOCH + timedelta(seconds=seconds)
+        else:
+            date = self._extra_dates.get(i)
+
+        pr_number = self._pr_numbers[i]
+        return Task(
+            title=title,
+            topic=self._strings[self._topics[i]],
+            description=self._descriptions.get(i),
+            status=self.STATUSES[self._statuses[i]],
+            commit_hash=commit_hash,
+            pr_number=None if pr_number == -1 else pr_number,
+            date=date,
+            repo=self._strings[self._repos[i]]
+        )
+
+
+def _is_lower_hex(text: str) -> bool:
+    """Check that a hash round-trips through int/format unchanged."""
+    return bool(text) and all(c in "0123456789abcdef" for c in text)
@@ -1,6 +1,19 @@
 """Services for status report generation."""
 
-from .git_service import GitService, get_week_range
-from .html_renderer import HtmlRenderer
+from importlib import import_module
 
 __all__ = ["GitService", "get_week_range", "HtmlRenderer"]
+
+# Exported names and their modules. Loaded on first access, so importing
+# one service does not import the others.
+_EXPORTS = {
+    "GitService": "git_service",
+    "get_week_range": "git_service",
+    "HtmlRenderer": "html_renderer",
+}
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,251 @@
+"""Local SQLite archive of generated reports for trend queries."""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from models.report import Report
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY,
+    author TEXT NOT NULL,
+    week_start TEXT NOT NULL,
+    week_end TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    UNIQUE (author, week_start)
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    report_id INTEGER NOT NULL REFERENCES reports (id) ON DELETE CASCADE,
+    author TEXT NOT NULL,
+    week_start TEXT NOT NULL,
+    section TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    topic TEXT,
+    description TEXT,
+    status TEXT NOT NULL,
+    commit_hash TEXT,
+    pr_number INTEGER,
+    date TEXT,
+    repo TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_report ON tasks (report_id);
+CREATE INDEX IF NOT EXISTS tasks_week_topic ON tasks (week_start, topic);
+CREATE INDEX IF NOT EXISTS tasks_author_week_topic ON tasks (author, week_start, topic);
+CREATE INDEX IF NOT EXISTS tasks_topic_week ON tasks (topic, week_start);
+CREATE INDEX IF NOT EXISTS tasks_status_week ON tasks (status, week_start);
+CREATE INDEX IF NOT EXISTS tasks_section_author_title ON tasks (section, author, title, week_start);
+"""
+
+STALE_BLOCKERS_QUERY = """
+WITH latest AS (
+    SELECT author, MAX(week_start) AS week_start FROM reports GROUP BY author
+)
+SELECT t.author, t.title, MAX(t.topic), MIN(t.week_start), MAX(t.week_start),
+       COUNT(DISTINCT t.week_start)
+FROM tasks AS t
+JOIN latest AS l ON l.author = t.author
+WHERE t.section = 'blockers' {author_filter}
+GROUP BY t.author, t.title
+HAVING MAX(t.week_start) = MAX(l.week_start)
+   AND (julianday(MAX(t.week_start)) - julianday(MIN(t.week_start))) / 7 + 1 > ?
+ORDER BY MIN(t.week_start), t.author, t.title
+"""
+
+TOPIC_TREND_QUERY = """
+SELECT week_start, topic, COUNT(*)
+FROM tasks
+WHERE week_start BETWEEN ? AND ? {author_filter}
+GROUP BY week_start, topic
+ORDER BY week_start, COUNT(*) DESC, topic
+"""
+
+
+@dataclass(frozen=True)
+class StaleBlocker:
+    """A blocker still listed in its author's latest archived report."""
+    author: str
+    title: str
+    topic: Optional[str]
+    first_week: date
+    last_week: date
+    reports: int
+
+    @property
+    def weeks_open(self) -> int:
+        """Weeks from the first report listing the blocker to the latest one, inclusive."""
+        return (self.last_week - self.first_week).days // 7 + 1
+
+
+@dataclass(frozen=True)
+class TopicWeek:
+    """Number of tasks on one topic in one week."""
+    week_start: date
+    topic: Optional[str]
+    tasks: int
+
+
+class ArchiveService:
+    """Stores reports in SQLite and answers trend queries across weeks.
+
+    Each report is stored once per author and week; archiving the same week
+    again replaces it. Tasks carry their report's week and author so the
+    trend queries are answered from indexes without joins over all reports.
+    """
+
+    DEFAULT_PATH = str(Path("output") / "archive.db")
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = Path(db_path or self.DEFAULT_PATH)
+        self._connection: Optional["sqlite3.Connection"] = None
+
+    @property
+    def connection(self) -> "sqlite3.Connection":
+        """Open the database on first use, creating the schema if needed."""
+        if self._connection is None:
+            # Imported here so that reading the CLI's archive options stays cheap
+            import sqlite3
+
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path)
+            connection.execute("PRAGMA foreign_keys = ON")
+            connection.execute("PRAGMA journal_mode = WAL")
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version > self.SCHEMA_VERSION:
+                connection.close()
+                raise RuntimeError(
+                    f"Archive {self.db_path} uses a newer schema (version {version})"
+                )
+            if version < self.SCHEMA_VERSION:
+                with connection:
+                    connection.executescript(SCHEMA)
+                    connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            self._connection = connection
+        return self._connection
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def save_report(self, report: Report) -> int:
+        """Archive a report, replacing any earlier one for the same author and week.
+
+        Returns the number of tasks stored.
+        """
+        week_start = report.week_start.date().isoformat()
+        rows = []
+        for key, section in zip(report.SECTION_KEYS, report.sections):
+            for position, task in enumerate(section.tasks):
+                rows.append((
+                    report.author, week_start, key, position,
+                    task.title, task.topic, task.description, task.status.value,
+                    task.commit_hash, task.pr_number,
+                    task.date.isoformat() if task.date else None,
+                    task.repo
+                ))
+
+        with self.connection as connection:
+            connection.execute(
+                "DELETE FROM reports WHERE author = ? AND week_start = ?",
+                (report.author, week_start)
+            )
+            report_id = connection.execute(
+                "INSERT INTO reports (author, week_start, week_end, generated_at) "
+                "VALUES (?, ?, ?, ?)",
+                (report.author, week_start, report.week_end.date().isoformat(),
+                 report.generated_at.isoformat())
+            ).lastrowid
+            connection.executemany(
+                "INSERT INTO tasks (report_id, author, week_start, section, position, title, "
+                "topic, description, status, commit_hash, pr_number, date, repo) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                ((report_id, *row) for row in rows)
+            )
+        return len(rows)
+
+    def weeks(self, author: Optional[str] = None) -> list[date]:
+        """Archived week start dates, oldest first."""
+        query = "SELECT DISTINCT week_start FROM reports"
+        params: tuple = ()
+        if author:
+            query += " WHERE author = ?"
+            params = (author,)
+        rows = self.connection.execute(query + " ORDER BY week_start", params)
+        return [date.fromisoformat(week) for week, in rows]
+
+    def stale_blockers(self, min_weeks: int = 2, author: Optional[str] = None) -> list[StaleBlocker]:
+        """Blockers open for more than ``min_weeks`` weeks.
+
+        A blocker is open if it is listed in its author's latest archived
+        report. It has been open since the first report listing it.
+        """
+        author_filter, params = self._author_filter(author, "t.")
+        rows = self.connection.execute(
+            STALE_BLOCKERS_QUERY.format(author_filter=author_filter),
+            (*params, min_weeks)
+        )
+        return [
+            StaleBlocker(
+                author=row[0],
+                title=row[1],
+                topic=row[2],
+                first_week=date.fromisoformat(row[3]),
+                last_week=date.fromisoformat(row[4]),
+                reports=row[5]
+            )
+            for row in rows
+        ]
+
+    def topic_trend(
+        self,
+        since: datetime,
+        until: datetime,
+        author: Optional[str] = None
+    ) -> list[TopicWeek]:
+        """Tasks per topic per week for the weeks starting within ``[since, until]``."""
+        author_filter, params = self._author_filter(author)
+        rows = self.connection.execute(
+            TOPIC_TREND_QUERY.format(author_filter=author_filter),
+            (since.date().isoformat(), until.date().isoformat(), *params)
+        )
+        return [
+            TopicWeek(week_start=date.fromisoformat(week), topic=topic, tasks=count)
+            for week, topic, count in rows
+        ]
+
+    def _author_filter(self, author: Optional[str], prefix: str = "") -> tuple[str, tuple]:
+        if not author:
+            return "", ()
+        return f"AND {prefix}author = ?", (author,)
+
+
+def parse_period(period: str) -> tuple[datetime, datetime]:
+    """Parse ``2026Q3``, ``2026`` or ``2026-07-01:2026-09-30`` into a date range."""
+    period = period.strip().upper()
+    try:
+        if ":" in period:
+            start, end = period.split(":", 1)
+            return datetime.strptime(start, "%Y-%m-%d"), datetime.strptime(end, "%Y-%m-%d")
+        if "Q" in period:
+            year, quarter = period.split("Q", 1)
+            year, quarter = int(year), int(quarter)
+            if not 1 <= quarter <= 4:
+                raise ValueError(period)
+            start = datetime(year, 3 * quarter - 2, 1)
+            end = datetime(year + 1, 1, 1) if quarter == 4 else datetime(year, 3 * quarter + 1, 1)
+            return start, end - timedelta(days=1)
+        year = int(period)
+        return datetime(year, 1, 1), datetime(year, 12, 31)
+    except ValueError:
+        raise ValueError(
+            f"Invalid period: {period}. Use YYYYQn, YYYY or YYYY-MM-DD:YYYY-MM-DD"
+        ) from None
@@ -0,0 +1,183 @@
+"""Persistent on-disk index of commits already read from a repository."""
+
+import bisect
+import mmap
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+
+class CommitIndex:
+    """Maps committer times to commit hashes, plus the indexed tip.
+
+    The file is a fixed-size header followed by fixed-width records of a
+    committer timestamp and a hash. The first ``sorted_count`` records are
+    sorted by time and searched in place through ``mmap`` with a binary
+    search, so nothing is loaded up front. Commits added later are appended
+    after them: sorted if they are no older than the last one, otherwise as
+    an unsorted tail that queries scan and that is merged into the sorted
+    part once it grows.
+    """
+
+    MAGIC = b"SRCI"
+    VERSION = 3
+
+    # Magic, format version, hash width, sorted record count, tip
+    _HEADER = struct.Struct("<4sHHQ64s")
+
+    # Tails longer than this share of the sorted records are merged into them
+    MAX_TAIL_RATIO = 16
+    MIN_TAIL = 1024
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.tip: Optional[str] = None
+        self._width = 0
+        self._sorted_count = 0
+        self._count = 0
+        self._last_time: Optional[int] = None
+        self._read_header()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def _record(self) -> struct.Struct:
+        return struct.Struct(f"<q{self._width}s")
+
+    def _read_header(self) -> None:
+        """Read the header, ignoring missing, corrupt or outdated files."""
+        try:
+            with self.path.open("rb") as f:
+                header = f.read(self._HEADER.size)
+                if len(header) != self._HEADER.size:
+                    return
+                magic, version, width, sorted_count, tip = self._HEADER.unpack(header)
+                if magic != self.MAGIC or version != self.VERSION or not width:
+                    return
+                size = os.fstat(f.fileno()).st_size - self._HEADER.size
+                record = struct.Struct(f"<q{width}s")
+                if size % record.size or sorted_count > size // record.size:
+                    return
+                last_time = None
+                if sorted_count:
+                    f.seek(self._HEADER.size + (sorted_count - 1) * record.size)
+                    last_time = record.unpack(f.read(record.size))[0]
+        except OSError:
+            return
+
+        self.tip = tip.rstrip(b"\0").decode("ascii") or None
+        self._width = width
+        self._sorted_count = sorted_count
+        self._count = size // record.size
+        self._last_time = last_time
+
+    def reset(self) -> None:
+        """Forget all indexed commits (e.g. after history was rewritten)."""
+        self.tip = None
+        self._width = 0
+        self._sorted_count = 0
+        self._count = 0
+        self._last_time = None
+
+    def add(self, commits: list[tuple[int, str]], tip: str) -> None:
+        """Add ``(commit_time, hash)`` pairs, record the new tip and write the file.
+
+        Records are appended in place. The file is only rewritten when it
+        is new, was reset, or its unsorted tail has grown too long.
+        """
+        commits = sorted(commits)
+        if not self._width:
+            self._width = len(tip)
+            self._write(commits, tip)
+            return
+
+        tail = self._count - self._sorted_count
+        stays_sorted = not tail and (
+            self._last_time is None or not commits or commits[0][0] >= self._last_time
+        )
+        if not stays_sorted and tail + len(commits) > max(
+            self.MIN_TAIL, self._sorted_count // self.MAX_TAIL_RATIO
+        ):
+            self._write(sorted(self._read_all() + commits), tip)
+            return
+
+        record = self._record
+        with self.path.open("r+b") as f:
+            # Clear the tip first: records appended without a tip are ignored,
+            # so an interrupted write leads to a rebuild, not a stale index
+            self._write_header(f, self._sorted_count, None)
+            f.seek(0, os.SEEK_END)
+            f.write(b"".join(record.pack(t, h.encode("ascii")) for t, h in commits))
+            if stays_sorted:
+                self._sorted_count += len(commits)
+                if commits:
+                    self._last_time = commits[-1][0]
+            self._count += len(commits)
+            self._write_header(f, self._sorted_count, tip)
+        self.tip = tip
+
+    def query(self, since: datetime, until: datetime) -> list[str]:
+        """Get the hashes of commits with a committer time in ``[since, until]``, newest first."""
+        if not self._count:
+            return []
+        since_ts = int(since.timestamp())
+        until_ts = int(until.timestamp())
+        record = self._record
+        with self.path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            times = _RecordTimes(data, record, self._HEADER.size, self._sorted_count)
+            lo = bisect.bisect_left(times, since_ts)
+            hi = bisect.bisect_right(times, until_ts, lo)
+            start = self._HEADER.size
+            matches = list(record.iter_unpack(data[start + lo * record.size:start + hi * record.size]))
+            tail_start = start + self._sorted_count * record.size
+            matches.extend(
+                (t, h) for t, h in record.iter_unpack(data[tail_start:])
+                if since_ts <= t <= until_ts
+            )
+        matches.sort(reverse=True)
+        return [h.decode("ascii") for _, h in matches]
+
+    def _read_all(self) -> list[tuple[int, str]]:
+        """Read every indexed record."""
+        with self.path.open("rb") as f:
+            f.seek(self._HEADER.size)
+            return [(t, h.decode("ascii")) for t, h in self._record.iter_unpack(f.read())]
+
+    def _write(self, commits: list[tuple[int, str]], tip: str) -> None:
+        """Write a whole index of sorted records atomically next to its final location."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        record = self._record
+        with tmp_path.open("wb") as f:
+            self._write_header(f, len(commits), tip)
+            f.write(b"".join(record.pack(t, h.encode("ascii")) for t, h in commits))
+        os.replace(tmp_path, self.path)
+        self.tip = tip
+        self._sorted_count = self._count = len(commits)
+        self._last_time = commits[-1][0] if commits else None
+
+    def _write_header(self, f, sorted_count: int, tip: Optional[str]) -> None:
+        f.seek(0)
+        f.write(self._HEADER.pack(
+            self.MAGIC, self.VERSION, self._width, sorted_count, (tip or "").encode("ascii")
+        ))
+        f.flush()
+
+
+class _RecordTimes:
+    """The committer times of a run of mapped records, as a sequence for ``bisect``."""
+
+    def __init__(self, data: mmap.mmap, record: struct.Struct, offset: int, count: int):
+        self._data = data
+        self._record = record
+        self._offset = offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> int:
+        return self._record.unpack_from(self._data, self._offset + index * self._record.size)[0]
@@ -0,0 +1,218 @@
+"""Single-file HTML slide deck built from the SVG slides."""
+
+import json
+from itertools import chain
+from typing import Optional
+
+from models.report import Report, TaskStatus
+from services.svg_renderer import SvgRenderer
+from services.template import CompiledTemplate, escape
+
+
+DECK_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Weekly Status Deck - {week_string}</title>
+    <style>
+        * {{
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }}
+        body {{
+            background: #05070a;
+            color: #8892a2;
+            font-family: 'JetBrains Mono', Consolas, monospace;
+            height: 100vh;
+            display: flex;
+            flex-direction: column;
+            overflow: hidden;
+        }}
+        .stage {{
+            flex: 1;
+            position: relative;
+        }}
+        .stage img {{
+            position: absolute;
+            inset: 0;
+            width: 100%;
+            height: 100%;
+            object-fit: contain;
+            visibility: hidden;
+        }}
+        .stage img.current {{
+            visibility: visible;
+        }}
+        .controls {{
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            gap: 20px;
+            padding: 12px;
+            font-size: 14px;
+        }}
+        .controls button {{
+            background: #0a0e14;
+            color: #bd93f9;
+            border: 1px solid #2d3a4d;
+            border-radius: 4px;
+            padding: 6px 14px;
+            font: inherit;
+            cursor: pointer;
+        }}
+    </style>
+</head>
+<body>
+    <div class="stage" id="stage"></div>
+    <div class="controls">
+        <button id="prev">&larr; Prev</button>
+        <span id="counter"></span>
+        <button id="next">Next &rarr;</button>
+    </div>
+    <script type="application/json" id="deck">{deck_json}</script>
+    <script>
+        (function () {{
+            var LOGO_TOKEN = {logo_token_json};
+            var LOGO_HREF = "data:image/png;base64,{logo}";
+            var WINDOW = {window};
+            // The summary slide, one template per task status and each
+            // task's own fields; task slides are assembled when shown
+            var deck = JSON.parse(document.getElementById("deck").textContent);
+            var templates = deck.templates.map(function (parts) {{
+                return parts.map(function (part) {{ return part.split(LOGO_TOKEN).join(LOGO_HREF); }});
+            }});
+            var count = deck.slides.length + 1;
+            var stage = document.getElementById("stage");
+            var counter = document.getElementById("counter");
+            var live = {{}};
+            var current = 0;
+
+            function slideSvg(i) {{
+                if (i === 0) return deck.summary.split(LOGO_TOKEN).join(LOGO_HREF);
+                var slide = deck.slides[i - 1];
+                var values = {{index: i}};
+                deck.fields.forEach(function (name, k) {{ values[name] = slide[k + 1]; }});
+                // Parts alternate between literal markup and field names
+                return templates[slide[0]].map(function (part, k) {{
+                    return k % 2 ? values[part] : part;
+                }}).join("");
+            }}
+
+            function materialize(i) {{
+                if (live[i]) return live[i];
+                var img = document.createElement("img");
+                img.src = URL.createObjectURL(new Blob([slideSvg(i)], {{type: "image/svg+xml"}}));
+                img.alt = "Slide " + (i + 1);
+                stage.appendChild(img);
+                live[i] = img;
+                return img;
+            }}
+
+            function release(i) {{
+                URL.revokeObjectURL(live[i].src);
+                stage.removeChild(live[i]);
+                delete live[i];
+            }}
+
+            function show(i) {{
+                current = Math.max(0, Math.min(count - 1, i));
+                Object.keys(live).forEach(function (key) {{
+                    var k = Number(key);
+                    if (Math.abs(k - current) > WINDOW) release(k);
+                    else live[k].className = "";
+                }});
+                for (var k = current - WINDOW; k <= current + WINDOW; k++) {{
+                    if (k >= 0 && k < count) materialize(k);
+                }}
+                live[current].className = "current";
+                counter.textContent = (current + 1) + " / " + count;
+                history.replaceState(null, "", "#" + (current + 1));
+            }}
+
+            document.getElementById("prev").onclick = function () {{ show(current - 1); }};
+            document.getElementById("next").onclick = function () {{ show(current + 1); }};
+            document.addEventListener("keydown", function (e) {{
+                if (e.key === "ArrowLeft" || e.key === "PageUp") show(current - 1);
+                else if (e.key === "ArrowRight" || e.key === "PageDown" || e.key === " ") show(current + 1);
+                else if (e.key === "Home") show(0);
+                else if (e.key === "End") show(count - 1);
+            }});
+
+            show((parseInt(location.hash.slice(1), 10) || 1) - 1);
+        }})();
+    </script>
+</body>
+</html>"""
+
+
+class DeckRenderer:
+    """Renders all SVG slides of a report into one self-contained HTML player.
+
+    Task slides are not embedded one by one: the deck holds one slide
+    template per task status and, for each task, only the fields that vary
+    (topic and wrapped description), which the player fills in when the
+    slide is shown. The logo is replaced by a placeholder and stored a
+    single time. The player only turns the slides within ``window``
+    positions of the current one into images, keeping very large decks
+    quick to open and light on memory.
+    """
+
+    # Placeholder substituted with the shared logo data URI in the browser
+    LOGO_TOKEN = "__DECK_LOGO__"
+
+    # Per-task fields embedded for each slide, in order
+    FIELDS = ("topic", "description")
+
+    _template = CompiledTemplate(DECK_TEMPLATE)
+
+    def __init__(self, svg_renderer: Optional[SvgRenderer] = None, window: int = 2):
+        self.svg_renderer = svg_renderer or SvgRenderer()
+        self.window = window
+
+    def render(self, report: Report) -> str:
+        """Render a report to a single-file HTML slide deck."""
+        all_tasks = chain.from_iterable(section.tasks for section in report.sections)
+        total = report.task_count
+
+        statuses = list(TaskStatus)
+        templates = [
+            self._template_parts(self.svg_renderer.task_slide_template(
+                status, total, report.author, report.week_string, logo_href=self.LOGO_TOKEN
+            ))
+            for status in statuses
+        ]
+        template_index = {status: i for i, status in enumerate(statuses)}
+
+        slides = []
+        for task in all_tasks:
+            fields = self.svg_renderer.task_fields(task)
+            slides.append([template_index[task.status], *(fields[name] for name in self.FIELDS)])
+
+        deck = {
+            "summary": self.svg_renderer.render_summary(report, logo_href=self.LOGO_TOKEN),
+            "templates": templates,
+            "fields": self.FIELDS,
+            "slides": slides
+        }
+        return self._template.render(
+            week_string=escape(report.week_string),
+            deck_json=self._script_json(deck),
+            logo_token_json=self._script_json(self.LOGO_TOKEN),
+            logo=self.svg_renderer.MEDIATEK_LOGO,
+            window=self.window
+        )
+
+    def _template_parts(self, template: CompiledTemplate) -> list[str]:
+        """Flatten a template into literal markup alternating with field names."""
+        parts = []
+        for literal, field in template.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(field[0])
+        return parts
+
+    def _script_json(self, value) -> str:
+        """Serialize a value as JSON that is safe inside a <script> element."""
+        return json.dumps(value).replace("</", "<\\/")
@@ -0,0 +1,258 @@
+"""Bounded, instrumented execution of git commands."""
+
+import atexit
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+
+class GitTimeoutError(RuntimeError):
+    """Raised when a git command does not finish within the executor's timeout."""
+
+
+@dataclass(frozen=True)
+class GitInvocation:
+    """Timing and outcome of a single git command."""
+    args: tuple[str, ...]
+    cwd: str
+    duration: float
+    returncode: Optional[int]
+    timed_out: bool = False
+    cancelled: bool = False
+
+
+class GitExecutor:
+    """Runs git commands with a concurrency limit, timeouts and an invocation log.
+
+    One executor can be shared by several ``GitService`` instances so the
+    limit applies across repositories. Revision lookups go through one
+    long-lived ``git cat-file --batch-check`` process per repository instead
+    of spawning ``git rev-parse`` each time.
+    """
+
+    def __init__(self, max_concurrency: int = 4, timeout: Optional[float] = 60.0):
+        self.timeout = timeout
+        self.invocations: list[GitInvocation] = []
+        self._slots = threading.BoundedSemaphore(max(1, max_concurrency))
+        self._log_lock = threading.Lock()
+        self._batch_lock = threading.Lock()
+        self._batch_processes: dict[str, subprocess.Popen] = {}
+        self._atexit_registered = False
+
+    def run(
+        self,
+        cwd: Path,
+        *args: str,
+        timeout: Optional[float] = None,
+        input: Optional[str] = None
+    ) -> str:
+        """Run a git command and return its stripped stdout.
+
+        ``input`` is written to the command's stdin (e.g. for ``--stdin``).
+        Raises RuntimeError if the command fails, GitTimeoutError (a
+        RuntimeError) if it exceeds its timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._slots:
+            start = time.perf_counter()
+            try:
+                result = subprocess.run(
+                    ["git", *args],
+                    cwd=cwd,
+                    input=input,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout
+                )
+            except subprocess.TimeoutExpired:
+                self._record(args, cwd, start, None, timed_out=True)
+                raise GitTimeoutError(
+                    f"Git command timed out after {timeout}s: git {' '.join(args)}"
+                )
+            self._record(args, cwd, start, result.returncode)
+
+        if result.returncode != 0:
+            raise RuntimeError(f"Git command failed: {result.stderr}")
+        return result.stdout.strip()
+
+    def stream(
+        self,
+        cwd: Path,
+        *args: str,
+        timeout: Optional[float] = None,
+        chunk_size: int = 65536
+    ) -> Iterator[bytes]:
+        """Run a git command and yield its stdout in chunks as it is produced.
+
+        The concurrency slot is held until the stream is exhausted or closed.
+        The process is killed when it exceeds the timeout or when the consumer
+        stops iterating early. Raises RuntimeError on failure, GitTimeoutError
+        on timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        with self._slots:
+            start = time.perf_counter()
+            process = subprocess.Popen(
+                ["git", *args],
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+            timed_out = threading.Event()
+
+            def kill_on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+            if timer is not None:
+                timer.start()
+            stderr = b""
+            completed = False
+            try:
+                while True:
+                    chunk = process.stdout.read1(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+                stderr = process.stderr.read()
+                completed = True
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                cancelled = False
+                if not completed and process.poll() is None:
+                    # The consumer stopped early or reading failed
+                    process.kill()
+                    cancelled = not timed_out.is_set()
+                returncode = process.wait()
+                process.stdout.close()
+                process.stderr.close()
+                self._record(args, cwd, start,
+                             None if timed_out.is_set() or cancelled else returncode,
+                             timed_out=timed_out.is_set(), cancelled=cancelled)
+
+        if timed_out.is_set():
+            raise GitTimeoutError(
+                f"Git command timed out after {timeout}s: git {' '.join(args)}"
+            )
+        if returncode != 0:
+            raise RuntimeError(f"Git command failed: {stderr.decode('utf-8', errors='replace')}")
+
+    def resolve(self, cwd: Path, rev: str) -> Optional[str]:
+        """Resolve a revision to an object id using a persistent batch process.
+
+        Returns None if the revision does not exist. Raises RuntimeError if
+        the batch process exits, GitTimeoutError if it does not answer
+        within the timeout; it is then killed and restarted by the next call.
+        """
+        key = str(Path(cwd).resolve())
+        args = ("cat-file", "--batch-check", rev)
+        timeout = self.timeout
+        with self._batch_lock:
+            start = time.perf_counter()
+            process = self._get_batch_process(key)
+            timed_out = threading.Event()
+
+            def kill_on_timeout() -> None:
+                timed_out.set()
+                process.kill()
+
+            timer = threading.Timer(timeout, kill_on_timeout) if timeout else None
+            if timer is not None:
+                timer.start()
+            try:
+                process.stdin.write(rev + "\n")
+                process.stdin.flush()
+                line = process.stdout.readline()
+            except (OSError, ValueError):
+                line = ""
+            finally:
+                if timer is not None:
+                    timer.cancel()
+            if not line:
+                # The batch process died or was killed: drop it so the next call restarts it
+                self._batch_processes.pop(key, None)
+                try:
+                    returncode = process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    returncode = -1
+                if timed_out.is_set():
+                    self._record(args, key, start, None, timed_out=True)
+                    raise GitTimeoutError(
+                        f"Git command timed out after {timeout}s: git {' '.join(args)}"
+                    )
+                self._record(args, key, start, returncode)
+                raise RuntimeError(f"git cat-file --batch-check exited in {key}")
+            self._record(args, key, start, 0)
+
+        parts = line.split()
+        if len(parts) < 2 or parts[1] == "missing":
+            return None
+        return parts[0]
+
+    def _get_batch_process(self, key: str) -> subprocess.Popen:
+        """Get or start the ``cat-file --batch-check`` process for a repository."""
+        process = self._batch_processes.get(key)
+        if process is None or process.poll() is not None:
+            process = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=key,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1
+            )
+            self._batch_processes[key] = process
+            if not self._atexit_registered:
+                atexit.register(self.close)
+                self._atexit_registered = True
+        return process
+
+    def close(self) -> None:
+        """Stop all long-lived batch processes."""
+        with self._batch_lock:
+            for process in self._batch_processes.values():
+                try:
+                    process.stdin.close()
+                    process.wait(timeout=5)
+                except (OSError, subprocess.TimeoutExpired):
+                    process.kill()
+            self._batch_processes.clear()
+
+    def _record(
+        self,
+        args: tuple[str, ...],
+        cwd: Path,
+        start: float,
+        returncode: Optional[int],
+        timed_out: bool = False,
+        cancelled: bool = False
+    ) -> None:
+        invocation = GitInvocation(
+            args=tuple(args),
+            cwd=str(cwd),
+            duration=time.perf_counter() - start,
+            returncode=returncode,
+            timed_out=timed_out,
+            cancelled=cancelled
+        )
+        with self._log_lock:
+            self.invocations.append(invocation)
+
+    def stats(self) -> dict[str, float]:
+        """Summarize the invocation log."""
+        with self._log_lock:
+            invocations = list(self.invocations)
+        return {
+            "commands": len(invocations),
+            "failed": sum(1 for i in invocations if i.returncode not in (0, None)),
+            "timed_out": sum(1 for i in invocations if i.timed_out),
+            "cancelled": sum(1 for i in invocations if i.cancelled),
+            "total_time": sum(i.duration for i in invocations)
+        }
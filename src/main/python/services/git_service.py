@@ -1,45 +1,149 @@
 """Service for extracting data from Git repositories."""
 
-import subprocess
 import re
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 from pathlib import Path
 
+from models.commit import CommitRecord
 from models.report import Task, TaskStatus
+from services.git_executor import GitExecutor, GitTimeoutError
+
+if TYPE_CHECKING:
+    from services.commit_index import CommitIndex
 
 
 class GitService:
-    """Extracts commit and PR information from a Git repository."""
+    """Extracts commit and PR information from a Git repository.
+
+    Git queries are memoized for the lifetime of the service. Commit ranges
+    are fetched once for all authors, so repeated or narrower queries over
+    an already fetched range are answered without another ``git log``, and
+    per-author ones without walking history again: only the fetched hashes
+    are passed to git to match the author. Use ``cache_stats`` to inspect hits and misses and
+    ``clear_cache`` to start over (e.g. after HEAD moved).
+
+    With a ``cache_dir`` commit times and hashes are also kept in a
+    persistent ``CommitIndex``. Each run only reads the commits between the
+    last indexed tip and HEAD. Date ranges are looked up in the index and
+    just the matching commits are read back from git with ``--no-walk``,
+    matching the author in the same call, so a query never walks history.
+    """
 
-    def __init__(self, repo_path: Optional[str] = None):
+    # Fields of a commit record: \x1f-separated, records NUL-separated via ``git log -z``
+    LOG_FORMAT = "%H%x1f%s%x1f%an%x1f%ae%x1f%at%x1f%ct"
+
+    def __init__(
+        self,
+        repo_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        executor: Optional[GitExecutor] = None
+    ):
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
+        self.executor = executor or GitExecutor()
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.commit_index: Optional["CommitIndex"] = None
+        self.clear_cache()
 
-    def _run_git(self, *args: str) -> str:
-        """Run a git command and return output."""
-        result = subprocess.run(
-            ["git", *args],
-            cwd=self.repo_path,
-            capture_output=True,
-            text=True
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"Git command failed: {result.stderr}")
-        return result.stdout.strip()
+    def clear_cache(self) -> None:
+        """Drop all memoized git query results."""
+        self._head: Optional[str] = None
+        self._config: Optional[dict[str, str]] = None
+        # (head, since, until) -> commits fetched for that window
+        self._commit_windows: dict[tuple, list[CommitRecord]] = {}
+        # (head, since, until, author, format) -> records for that exact query
+        self._query_cache: dict[tuple, list[CommitRecord]] = {}
+        self._index_current = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_stats(self) -> dict[str, int]:
+        """Get query cache hit/miss counts for diagnostics."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "windows": len(self._commit_windows)
+        }
+
+    def _run_git(self, *args: str, input: Optional[str] = None) -> str:
+        """Run a git command through the executor and return output."""
+        return self.executor.run(self.repo_path, *args, input=input)
+
+    def get_head(self) -> str:
+        """Get the commit hash of HEAD, resolved once per cache lifetime."""
+        if self._head is None:
+            try:
+                self._head = self.executor.resolve(self.repo_path, "HEAD") or ""
+            except GitTimeoutError:
+                raise
+            except RuntimeError:
+                self._head = ""
+        return self._head
+
+    def refresh_head(self) -> str:
+        """Re-resolve HEAD, dropping query results cached for an older HEAD.
+
+        For long-running processes: a single round trip to the persistent
+        ``cat-file`` process, no new git process.
+        """
+        previous = self._head
+        self._head = None
+        head = self.get_head()
+        if head != previous:
+            self._commit_windows.clear()
+            self._query_cache.clear()
+            self._index_current = False
+        return head
+
+    def get_config(self) -> dict[str, str]:
+        """Get the effective git configuration from a single ``git config --list``."""
+        if self._config is None:
+            self.cache_misses += 1
+            config = {}
+            try:
+                output = self._run_git("config", "--list")
+            except GitTimeoutError:
+                raise
+            except RuntimeError:
+                output = ""
+            for line in output.split("\n"):
+                key, sep, value = line.partition("=")
+                if sep:
+                    # Later entries override earlier ones, as in git itself
+                    config[key.lower()] = value
+            self._config = config
+        else:
+            self.cache_hits += 1
+        return self._config
 
     def get_author_name(self) -> str:
         """Get the configured git user name."""
-        try:
-            return self._run_git("config", "user.name")
-        except RuntimeError:
-            return "Unknown Author"
+        return self.get_config().get("user.name") or "Unknown Author"
 
     def get_author_email(self) -> str:
         """Get the configured git user email."""
+        return self.get_config().get("user.email", "")
+
+    def prefetch(self, since: Optional[datetime] = None, until: Optional[datetime] = None) -> None:
+        """Do the part of a commit query that does not depend on the author.
+
+        Resolves HEAD and, with a commit index, brings the index up to date.
+        Given a range, also fetches it for all authors from the index, so a
+        following per-author query over it only has to match the author.
+        Meant to run while the author is still being looked up; errors
+        other than timeouts are left for the query itself to handle.
+        """
+        self.get_head()
+        if self.cache_dir is None:
+            return
         try:
-            return self._run_git("config", "user.email")
+            self._update_commit_index()
+        except GitTimeoutError:
+            raise
         except RuntimeError:
-            return ""
+            return
+        if since is not None and until is not None:
+            self.get_commit_records(since, until)
 
     def get_commits(
         self,
@@ -48,82 +152,407 @@ class GitService:
         author: Optional[str] = None
     ) -> list[Task]:
         """Get commits within a date range."""
-        since_str = since.strftime("%Y-%m-%d")
-        until_str = until.strftime("%Y-%m-%d")
+        return [record.to_task() for record in self.get_commit_records(since, until, author)]
 
-        args = [
-            "log",
-            f"--since={since_str}",
-            f"--until={until_str}",
-            "--pretty=format:%H|%s|%ad",
-            "--date=iso"
-        ]
+    def get_commit_records(
+        self,
+        since: datetime,
+        until: datetime,
+        author: Optional[str] = None
+    ) -> list[CommitRecord]:
+        """Get commit records within a date range, answered from the cache when possible.
 
+        Raises GitTimeoutError if git does not answer in time; other git
+        failures (e.g. not a repository) give no commits.
+        """
+        head = self.get_head()
+        since_str = since.strftime("%Y-%m-%d %H:%M:%S")
+        until_str = until.strftime("%Y-%m-%d %H:%M:%S")
+
+        key = (head, since_str, until_str, author, self.LOG_FORMAT)
+        if key in self._query_cache:
+            self.cache_hits += 1
+            return self._query_cache[key]
+
+        records = self._get_window(head, since, until)
+        if records is not None:
+            self.cache_hits += 1
+            if author:
+                try:
+                    records = self._filter_author(records, author)
+                except GitTimeoutError:
+                    raise
+                except RuntimeError:
+                    return []
+        else:
+            self.cache_misses += 1
+            try:
+                if self.cache_dir is not None:
+                    hashes = self._update_commit_index().query(since, until)
+                    records = self._read_commits(hashes, author)
+                else:
+                    # With an author, only their commits are needed, so git selects them
+                    records = list(self.iter_commits(since, until, author=author))
+            except GitTimeoutError:
+                raise
+            except RuntimeError:
+                return []
+            if not author:
+                self._commit_windows[(head, since, until)] = records
+
+        self._query_cache[key] = records
+        return records
+
+    def _get_window(
+        self,
+        head: str,
+        since: datetime,
+        until: datetime
+    ) -> Optional[list[CommitRecord]]:
+        """Answer a range from an already fetched window that covers it."""
+        for (window_head, window_since, window_until), records in self._commit_windows.items():
+            if window_head != head or window_since > since or window_until < until:
+                continue
+            if (window_since, window_until) == (since, until):
+                return records
+            since_ts = since.timestamp()
+            until_ts = until.timestamp()
+            return [r for r in records if since_ts <= r.commit_time <= until_ts]
+        return None
+
+    def _update_commit_index(self) -> "CommitIndex":
+        """Bring the on-disk commit index up to date with HEAD, once per cache lifetime."""
+        if self.commit_index is None:
+            import hashlib
+
+            from services.commit_index import CommitIndex
+
+            repo_key = hashlib.sha1(str(self._repo_root()).encode("utf-8")).hexdigest()[:16]
+            self.commit_index = CommitIndex(self.cache_dir / f"commits_{repo_key}.idx")
+
+        index = self.commit_index
+        if self._index_current:
+            return index
+
+        head = self.get_head()
+        if not head:
+            raise RuntimeError("Repository has no HEAD commit")
+
+        if index.tip != head:
+            if index.tip and self._is_ancestor(index.tip, head):
+                # Only read commits that are new since the last indexed tip
+                revision_range = f"{index.tip}..{head}"
+            else:
+                # First run, or history was rewritten / HEAD moved elsewhere
+                index.reset()
+                revision_range = head
+            index.add(list(self._iter_commit_times(revision_range)), head)
+
+        self._index_current = True
+        return index
+
+    def _repo_root(self) -> Path:
+        """Find the working tree root without starting git, so subdirectories share an index."""
+        path = self.repo_path.resolve()
+        for candidate in (path, *path.parents):
+            if (candidate / ".git").exists():
+                return candidate
+        return path
+
+    def _iter_commit_times(self, revision_range: str) -> Iterator[tuple[int, str]]:
+        """Stream ``(commit_time, hash)`` for every commit in a revision range."""
+        pending = b""
+        for chunk in self.executor.stream(self.repo_path, "log", "--format=%ct %H", revision_range):
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                commit_time, _, commit_hash = line.decode("ascii").partition(" ")
+                if commit_hash:
+                    yield int(commit_time), commit_hash
+        commit_time, _, commit_hash = pending.decode("ascii").partition(" ")
+        if commit_hash:
+            yield int(commit_time), commit_hash
+
+    def _read_commits(self, hashes: list[str], author: Optional[str] = None) -> list[CommitRecord]:
+        """Read the records of the given commits, in order, keeping ``author``'s.
+
+        The hashes are passed on stdin with ``--no-walk``, so git reads only
+        those commits instead of walking history.
+        """
+        if not hashes:
+            # With nothing on stdin git would fall back to HEAD
+            return []
+        args = ["log", "--no-walk=unsorted", "--stdin", "-z", f"--pretty=format:{self.LOG_FORMAT}"]
         if author:
             args.append(f"--author={author}")
+        output = self._run_git(*args, input="\n".join(hashes) + "\n")
+        records = []
+        for raw in output.split("\0"):
+            record = self._parse_record(raw)
+            if record is not None:
+                records.append(record)
+        return records
 
+    def _is_ancestor(self, ancestor: str, commit: str) -> bool:
+        """Check whether ``ancestor`` is reachable from ``commit``."""
         try:
-            output = self._run_git(*args)
+            self._run_git("merge-base", "--is-ancestor", ancestor, commit)
+        except GitTimeoutError:
+            raise
         except RuntimeError:
-            return []
+            return False
+        return True
 
-        if not output:
+    def iter_commits(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        author: Optional[str] = None,
+        revision_range: Optional[str] = None
+    ) -> Iterator[CommitRecord]:
+        """Stream commits from ``git log -z`` as they are produced.
+
+        Output is read from the git pipe in chunks and parsed record by
+        record, so memory stays flat over long ranges and the first commits
+        are available before git finishes. Records are NUL-separated and
+        fields are ``\x1f``-separated, so subjects may contain any printable
+        character, and dates are read as unix timestamps.
+        """
+        args = ["log", "-z", f"--pretty=format:{self.LOG_FORMAT}"]
+        if since is not None:
+            args.append(f"--since={since.strftime('%Y-%m-%d %H:%M:%S')}")
+        if until is not None:
+            args.append(f"--until={until.strftime('%Y-%m-%d %H:%M:%S')}")
+        if author:
+            args.append(f"--author={author}")
+        if revision_range:
+            args.append(revision_range)
+
+        pending = b""
+        for chunk in self.executor.stream(self.repo_path, *args):
+            pending += chunk
+            *complete, pending = pending.split(b"\0")
+            for raw in complete:
+                record = self._parse_record(raw.decode("utf-8", errors="replace"))
+                if record is not None:
+                    yield record
+        if pending:
+            record = self._parse_record(pending.decode("utf-8", errors="replace"))
+            if record is not None:
+                yield record
+
+    def _parse_record(self, raw: str) -> Optional[CommitRecord]:
+        """Parse one ``LOG_FORMAT`` record."""
+        parts = raw.split("\x1f")
+        if len(parts) != 6:
+            return None
+        commit_hash, subject, author_name, author_email, author_time, commit_time = parts
+        try:
+            author_date = datetime.fromtimestamp(int(author_time))
+            commit_time = int(commit_time)
+        except ValueError:
+            return None
+        return CommitRecord(
+            hash=commit_hash.strip(),
+            subject=subject,
+            author_name=author_name,
+            author_email=author_email,
+            author_date=author_date,
+            commit_time=commit_time
+        )
+
+    def _filter_author(self, records: list[CommitRecord], author: str) -> list[CommitRecord]:
+        """Keep the records ``git log --author`` matches.
+
+        git reads the value as a basic regex over "name <email>", where
+        parentheses, ``+``, ``?`` and ``|`` mean something else than in
+        Python's ``re``, so the matching is left to git. Only the records'
+        own hashes are passed in, with ``--no-walk``, so git never walks
+        history.
+        """
+        if not records:
+            # With nothing on stdin git would fall back to HEAD
             return []
+        output = self._run_git(
+            "log",
+            "--no-walk=unsorted",
+            "--stdin",
+            f"--author={author}",
+            "--format=%H",
+            input="\n".join(r.hash for r in records) + "\n"
+        )
+        hashes = set(output.split("\n"))
+        return [r for r in records if r.hash in hashes]
 
-        tasks = []
-        for line in output.split("\n"):
-            if not line.strip():
-                continue
-            parts = line.split("|", 2)
-            if len(parts) >= 2:
-                commit_hash = parts[0][:7]
-                message = parts[1]
-                date = None
-                if len(parts) >= 3:
-                    try:
-                        date = datetime.fromisoformat(parts[2].replace(" ", "T").split("+")[0])
-                    except ValueError:
-                        pass
-
-                task = Task(
-                    title=message,
-                    commit_hash=commit_hash,
-                    status=TaskStatus.COMPLETED,
-                    date=date
+    def get_commits_by_author(
+        self,
+        since: datetime,
+        until: datetime
+    ) -> dict[str, tuple[str, list[Task]]]:
+        """Partition the commits of a range by normalized author identity.
+
+        The range is read with a single (cached) git log pass. Identities are
+        resolved through the repository's ``.mailmap`` and keyed by lowercased
+        email, so one person committing under several names or addresses gets
+        one entry. Returns ``{identity: (display_name, tasks)}``.
+        """
+        records = self.get_commit_records(since, until)
+        identities = self.resolve_identities(
+            {(r.author_name, r.author_email) for r in records}
+        )
+
+        partitions: dict[str, tuple[str, list[Task]]] = {}
+        for record in records:
+            name, email = identities[(record.author_name, record.author_email)]
+            key = email.lower() or name.lower()
+            if key not in partitions:
+                partitions[key] = (name, [])
+            partitions[key][1].append(record.to_task())
+
+        return partitions
+
+    def resolve_identities(
+        self,
+        identities: set[tuple[str, str]]
+    ) -> dict[tuple[str, str], tuple[str, str]]:
+        """Map raw (name, email) pairs to their canonical ``.mailmap`` identity."""
+        resolved = {identity: identity for identity in identities}
+        pending = sorted(identities)
+        batch_size = 200
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            try:
+                output = self._run_git(
+                    "check-mailmap", *(f"{name} <{email}>" for name, email in batch)
                 )
-                tasks.append(task)
+            except GitTimeoutError:
+                raise
+            except RuntimeError:
+                # No usable mailmap support: keep identities as recorded
+                break
+            for identity, line in zip(batch, output.split("\n")):
+                name, sep, email = line.rpartition(" <")
+                if sep:
+                    resolved[identity] = (name, email.rstrip(">"))
 
-        return tasks
+        return resolved
+
+    # Long-lived branches that never count as work in progress
+    MAINLINE_BRANCHES = ("main", "master", "develop")
+
+    # Fields of a branch record for ``git for-each-ref``
+    REF_FORMAT = (
+        "%(refname)%1f%(objectname:short)%1f%(committerdate:unix)%1f"
+        "%(authorname)%1f%(authoremail)%1f%(upstream)"
+    )
+
+    def get_branches_in_progress(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        author: Optional[str] = None,
+        include_remote: bool = False
+    ) -> list[Task]:
+        """Get branches that represent work in progress.
 
-    def get_branches_in_progress(self) -> list[Task]:
-        """Get branches that might represent work in progress."""
+        Uses a single ``git for-each-ref`` sorted by committer date, newest
+        first, so the scan stops at the first ref older than ``since`` no
+        matter how many refs the repository has. Branches are kept if their
+        tip falls in ``[since, until]`` and its author matches ``author``
+        (a regex over "name <email>", like ``git log --author``). Remote
+        branches are only scanned with ``include_remote``, and are skipped
+        when a local branch tracking them is already listed.
+        """
+        patterns = ["refs/heads/"]
+        if include_remote:
+            patterns.append("refs/remotes/")
+
+        since_ts = since.timestamp() if since else None
+        until_ts = until.timestamp() if until else None
+        author_pattern = self._compile_author(author)
+
+        branches = []
+        seen_upstreams = set()
         try:
-            output = self._run_git("branch", "--list")
+            for refname, short_hash, commit_time, name, email, upstream in self._iter_refs(*patterns):
+                if since_ts is not None and commit_time < since_ts:
+                    break  # Sorted newest first: everything after is older
+                if until_ts is not None and commit_time > until_ts:
+                    continue
+                if author_pattern and not author_pattern.search(f"{name} {email}"):
+                    continue
+
+                if refname.startswith("refs/heads/"):
+                    branch_name = refname[len("refs/heads/"):]
+                    if upstream:
+                        seen_upstreams.add(upstream)
+                else:
+                    if refname.endswith("/HEAD"):
+                        continue
+                    # refs/remotes/<remote>/<branch>
+                    branch_name = refname[len("refs/remotes/"):].split("/", 1)[-1]
+
+                if branch_name in self.MAINLINE_BRANCHES:
+                    continue
+                branches.append((refname, branch_name, short_hash, commit_time, upstream))
+        except GitTimeoutError:
+            raise
         except RuntimeError:
             return []
 
         tasks = []
-        current_branch = None
-
-        for line in output.split("\n"):
-            line = line.strip()
-            if line.startswith("* "):
-                current_branch = line[2:]
-            elif line and line not in ["main", "master", "develop"]:
-                branch_name = line.replace("-", " ").replace("_", " ")
-                if not branch_name.lower().startswith(("feature", "fix", "bugfix")):
-                    title = branch_name
-                else:
-                    title = " ".join(branch_name.split()[1:]) if " " in branch_name else branch_name
-
-                if title:
-                    tasks.append(Task(
-                        title=f"Branch: {title}",
-                        status=TaskStatus.IN_PROGRESS
-                    ))
+        for refname, branch_name, short_hash, commit_time, upstream in branches:
+            if refname.startswith("refs/remotes/") and refname in seen_upstreams:
+                continue
+            title = self._branch_title(branch_name)
+            if not title:
+                continue
+            tasks.append(Task(
+                title=f"Branch: {title}",
+                description=f"Tracking {upstream.replace('refs/remotes/', '', 1)}" if upstream else None,
+                status=TaskStatus.IN_PROGRESS,
+                commit_hash=short_hash,
+                date=datetime.fromtimestamp(commit_time)
+            ))
 
         return tasks
 
+    def _iter_refs(self, *patterns: str) -> Iterator[tuple[str, str, int, str, str, str]]:
+        """Stream refs newest first as (refname, hash, committer time, author, email, upstream)."""
+        args = [
+            "for-each-ref",
+            "--sort=-committerdate",
+            f"--format={self.REF_FORMAT}",
+            *patterns
+        ]
+        pending = b""
+        for chunk in self.executor.stream(self.repo_path, *args):
+            pending += chunk
+            *lines, pending = pending.split(b"\n")
+            for line in lines:
+                parts = line.decode("utf-8", errors="replace").split("\x1f")
+                if len(parts) != 6 or not parts[2]:
+                    continue
+                refname, short_hash, commit_time, name, email, upstream = parts
+                yield refname, short_hash, int(commit_time), name, email, upstream
+
+    def _compile_author(self, author: Optional[str]) -> Optional[re.Pattern]:
+        """Compile an author filter, treating invalid regexes as literal text."""
+        if not author:
+            return None
+        try:
+            return re.compile(author)
+        except re.error:
+            return re.compile(re.escape(author))
+
+    def _branch_title(self, branch_name: str) -> str:
+        """Turn a branch name like ``feature/login-page`` into a readable title."""
+        words = branch_name.replace("/", " ").replace("-", " ").replace("_", " ").split()
+        if len(words) > 1 and words[0].lower() in ("feature", "fix", "bugfix"):
+            words = words[1:]
+        return " ".join(words)
+
     def get_recent_pr_references(self, since: datetime, until: datetime) -> list[Task]:
         """Extract PR references from commit messages."""
         commits = self.get_commits(since, until)
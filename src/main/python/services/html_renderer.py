@@ -1,6 +1,9 @@
 """HTML rendering service for status reports."""
 
+from typing import Iterator, Optional, TextIO
+
 from models.report import Report, Section
+from services.template import CompiledTemplate, escape
 
 
 HTML_TEMPLATE = """<!DOCTYPE html>
@@ -146,27 +149,60 @@ HTML_TEMPLATE = """<!DOCTYPE html>
 class HtmlRenderer:
     """Renders reports to HTML format."""
 
+    # Template split once into static and dynamic segments so reports can be streamed
+    _template = CompiledTemplate(HTML_TEMPLATE)
+
     def render(self, report: Report) -> str:
         """Render a report to HTML."""
-        return HTML_TEMPLATE.format(
-            week_string=report.week_string,
-            author=report.author,
-            accomplished_content=self._render_section(report.accomplished),
-            in_progress_content=self._render_section(report.in_progress),
-            blockers_content=self._render_section(report.blockers),
-            generated_at=report.generated_at.strftime("%B %d, %Y at %I:%M %p")
-        )
-
-    def _render_section(self, section: Section) -> str:
+        return "".join(self.iter_render(report))
+
+    def render_to(self, report: Report, fp: TextIO) -> None:
+        """Render a report to HTML, writing it to a file-like object."""
+        for chunk in self.iter_render(report):
+            fp.write(chunk)
+
+    def iter_render(
+        self,
+        report: Report,
+        rendered_sections: Optional[dict[str, str]] = None
+    ) -> Iterator[str]:
+        """Render a report to HTML as a stream of chunks.
+
+        Sections are produced task by task, so the full document is never
+        held in memory at once. ``rendered_sections`` maps section keys
+        (``accomplished``, ``in_progress``, ``blockers``) to HTML from
+        ``render_section`` that is reused instead of re-rendering them.
+        """
+        rendered_sections = rendered_sections or {}
+        values = {
+            "week_string": escape(report.week_string),
+            "author": escape(report.author),
+            "generated_at": report.generated_at.strftime("%B %d, %Y at %I:%M %p")
+        }
+        for key, section in zip(report.SECTION_KEYS, report.sections):
+            if key in rendered_sections:
+                values[f"{key}_content"] = rendered_sections[key]
+            else:
+                values[f"{key}_content"] = self._iter_section(section)
+        return self._template.iter_render(values)
+
+    def render_section(self, section: Section) -> str:
         """Render a section's tasks to HTML."""
+        return "".join(self._iter_section(section))
+
+    def _iter_section(self, section: Section) -> Iterator[str]:
+        """Render a section's tasks to HTML, one task at a time."""
         if not section.tasks:
-            return '<p class="empty-section">No items to report.</p>'
+            yield '<p class="empty-section">No items to report.</p>'
+            return
 
-        items = []
+        yield '<ul class="task-list">'
         for task in section.tasks:
             meta_parts = []
+            if task.repo:
+                meta_parts.append(escape(task.repo))
             if task.commit_hash:
-                meta_parts.append(f"<code>{task.commit_hash}</code>")
+                meta_parts.append(f"<code>{escape(task.commit_hash)}</code>")
             if task.pr_number:
                 meta_parts.append(f"PR #{task.pr_number}")
             if task.date:
@@ -178,12 +214,11 @@ class HtmlRenderer:
 
             description_html = ""
             if task.description:
-                description_html = f'<div class="task-description">{task.description}</div>'
+                description_html = f'<div class="task-description">{escape(task.description)}</div>'
 
-            items.append(f"""<li>
-                <div class="task-title">{task.title}</div>
+            yield f"""<li>
+                <div class="task-title">{escape(task.title)}</div>
                 {description_html}
                 {meta_html}
-            </li>""")
-
-        return f'<ul class="task-list">{"".join(items)}</ul>'
+            </li>"""
+        yield '</ul>'
@@ -0,0 +1,138 @@
+"""Service for reading dated entries from a task journal."""
+
+import bisect
+import re
+import struct
+from array import array
+from datetime import datetime
+from typing import Iterator, Optional
+
+from models.report import Task, TaskStatus
+from services.task_file_service import TaskFileService
+
+
+class JournalService(TaskFileService):
+    """Reads ``YYYYMMDD - task`` journal lines for a given week.
+
+    A sorted index of (date, byte offset) pairs is built in a single scan of
+    the file and cached next to it as ``.<name>.idx``. The cache is rebuilt
+    whenever the journal's mtime or size changes. Week lookups binary-search
+    the index and only read the lines that fall inside the week, so a
+    multi-year journal is not parsed in full for every report.
+    """
+
+    # Lines starting with an 8-digit date are journal entries
+    DATE_PREFIX = re.compile(rb"^\s*(\d{8})\b")
+    # "20260117 - text", "20260117 Sunday - text", "20260117: text"
+    ENTRY_PATTERN = re.compile(
+        r"^\s*(\d{8})(?:\s+(?:mon|tue|wed|thu|fri|sat|sun)[a-z]*)?\s*[-:]?\s*(.+)$",
+        re.IGNORECASE
+    )
+
+    INDEX_MAGIC = b"JIDX"
+    INDEX_VERSION = 1
+    INDEX_HEADER = struct.Struct("<4sIqqq")
+
+    def __init__(self, file_path: Optional[str] = None):
+        super().__init__(file_path)
+        self.index_path = self.file_path.with_name(f".{self.file_path.name}.idx")
+        self._dates = array("q")
+        self._offsets = array("q")
+        self._index_key: Optional[tuple[int, int]] = None
+
+    def read_week(self, week_start: datetime, week_end: datetime) -> list[Task]:
+        """Read the journal entries dated within ``[week_start, week_end]``."""
+        return list(self.iter_week(week_start, week_end))
+
+    def iter_week(self, week_start: datetime, week_end: datetime) -> Iterator[Task]:
+        """Stream the journal entries dated within a week, in date order."""
+        if not self.file_exists():
+            return
+        self._ensure_index()
+
+        first = int(week_start.strftime("%Y%m%d"))
+        last = int(week_end.strftime("%Y%m%d"))
+        lo = bisect.bisect_left(self._dates, first)
+        hi = bisect.bisect_right(self._dates, last)
+        if lo == hi:
+            return
+
+        with self.file_path.open("rb") as f:
+            for offset in self._offsets[lo:hi]:
+                f.seek(offset)
+                task = self._parse_entry(f.readline().decode("utf-8", errors="replace"))
+                if task is not None:
+                    yield task
+
+    def _parse_entry(self, line: str) -> Optional[Task]:
+        """Parse a dated journal line into a completed Task."""
+        match = self.ENTRY_PATTERN.match(line.strip())
+        if not match:
+            return None
+        try:
+            date = datetime.strptime(match.group(1), "%Y%m%d")
+        except ValueError:
+            return None
+        task = self._parse_task_line(match.group(2).strip(), TaskStatus.COMPLETED)
+        task.date = date
+        return task
+
+    def _ensure_index(self) -> None:
+        """Load the cached index, rebuilding it if the journal changed."""
+        stat = self.file_path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+        if self._index_key == key:
+            return
+        if not self._load_index(key):
+            self._build_index()
+            self._save_index(key)
+        self._index_key = key
+
+    def _build_index(self) -> None:
+        """Scan the journal once and collect sorted (date, offset) pairs."""
+        entries = []
+        offset = 0
+        with self.file_path.open("rb") as f:
+            for line in f:
+                match = self.DATE_PREFIX.match(line)
+                if match:
+                    entries.append((int(match.group(1)), offset))
+                offset += len(line)
+
+        # Sorting on (date, offset) keeps file order within a day
+        entries.sort()
+        self._dates = array("q", (date for date, _ in entries))
+        self._offsets = array("q", (offset for _, offset in entries))
+
+    def _load_index(self, key: tuple[int, int]) -> bool:
+        """Load the index from disk if it matches the journal's mtime and size."""
+        try:
+            with self.index_path.open("rb") as f:
+                header = f.read(self.INDEX_HEADER.size)
+                magic, version, mtime_ns, size, count = self.INDEX_HEADER.unpack(header)
+                if (magic, version, (mtime_ns, size)) != (self.INDEX_MAGIC, self.INDEX_VERSION, key):
+                    return False
+                dates = array("q")
+                offsets = array("q")
+                dates.fromfile(f, count)
+                offsets.fromfile(f, count)
+        except (OSError, EOFError, struct.error):
+            return False
+
+        self._dates = dates
+        self._offsets = offsets
+        return True
+
+    def _save_index(self, key: tuple[int, int]) -> None:
+        """Write the index next to the journal; a read-only location is not an error."""
+        try:
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            with tmp_path.open("wb") as f:
+                f.write(self.INDEX_HEADER.pack(
+                    self.INDEX_MAGIC, self.INDEX_VERSION, key[0], key[1], len(self._dates)
+                ))
+                self._dates.tofile(f)
+                self._offsets.tofile(f)
+            tmp_path.replace(self.index_path)
+        except OSError:
+            pass
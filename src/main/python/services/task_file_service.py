@@ -1,22 +1,59 @@
 """Service for reading tasks from a text file."""
 
+import glob
+import json
+import os
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from models.report import Task, TaskStatus
 
 
 class TaskFileService:
-    """Reads tasks from a structured text file."""
+    """Reads tasks from a structured text file.
+
+    The path may also be a directory or glob of daily ``YYYYMMDD_task.txt``
+    files. Only the files dated inside the requested week are read, uncached
+    ones are parsed in parallel, and parse results are cached on disk keyed
+    by path, mtime and size.
+    """
+
+    # Read buffer for streaming large task files
+    READ_BUFFER_SIZE = 1024 * 1024
 
     # Pattern to match [Topic] at the start of a task
     TOPIC_PATTERN = re.compile(r'^\[([^\]]+)\]\s*(.+)$')
 
-    def __init__(self, file_path: Optional[str] = None):
+    # Daily task files are named after their date, e.g. 20260117_task.txt
+    DAILY_FILE_PATTERN = re.compile(r'^(\d{8})_task\.txt$')
+    DAILY_FILE_GLOB = "*_task.txt"
+
+    # Parsed daily files, keyed by path, mtime and size
+    CACHE_FILENAME = "task_files.json"
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        jobs: int = 4
+    ):
         if file_path:
             self.file_path = Path(file_path)
         else:
             self.file_path = Path("tasks.txt")
+        self.cache_path = Path(cache_dir) / self.CACHE_FILENAME if cache_dir else None
+        self.jobs = max(1, jobs)
+        self._cache: Optional[dict[str, dict]] = None
+        self._cache_dirty = False
+        self.files_parsed = 0
+        self.files_cached = 0
+
+    @property
+    def is_daily(self) -> bool:
+        """Whether the path names a directory or glob of daily task files."""
+        return self.file_path.is_dir() or glob.has_magic(str(self.file_path))
 
     def _parse_task_line(self, task_text: str, status: TaskStatus) -> Task:
         """Parse a task line, extracting topic if present."""
@@ -34,6 +71,18 @@ class TaskFileService:
             status=status
         )
 
+    # Section headers and the status given to tasks listed under them
+    SECTION_HEADERS = (
+        ("## ACCOMPLISHED", "accomplished"),
+        ("## IN PROGRESS", "in_progress"),
+        ("## BLOCKERS", "blockers")
+    )
+    STATUS_MAP = {
+        "accomplished": TaskStatus.COMPLETED,
+        "in_progress": TaskStatus.IN_PROGRESS,
+        "blockers": TaskStatus.BLOCKED
+    }
+
     def read_tasks(self) -> dict[str, list[Task]]:
         """Read tasks from file and return categorized tasks."""
         result = {
@@ -42,19 +91,45 @@ class TaskFileService:
             "blockers": []
         }
 
+        for section, task in self.iter_tasks():
+            result[section].append(task)
+
+        return result
+
+    def iter_tasks(
+        self,
+        week_start: Optional[datetime] = None,
+        week_end: Optional[datetime] = None
+    ) -> Iterator[tuple[str, Task]]:
+        """Stream ``(section, task)`` pairs from the file as it is read.
+
+        The file is read line by line through a buffered reader, so very large
+        task logs are never loaded into memory at once. For daily task files,
+        the week bounds select which files are read.
+        """
+        if self.is_daily:
+            yield from self._iter_daily_tasks(week_start, week_end)
+            return
+
         if not self.file_path.exists():
-            return result
+            return
 
-        content = self.file_path.read_text(encoding="utf-8")
-        current_section = None
+        with self.file_path.open("r", encoding="utf-8", buffering=self.READ_BUFFER_SIZE) as f:
+            yield from self._iter_lines(f)
 
-        status_map = {
-            "accomplished": TaskStatus.COMPLETED,
-            "in_progress": TaskStatus.IN_PROGRESS,
-            "blockers": TaskStatus.BLOCKED
-        }
+    def _iter_lines(
+        self,
+        lines: Iterable[str],
+        default_section: Optional[str] = None
+    ) -> Iterator[tuple[str, Task]]:
+        """Parse task lines, tracking ``## SECTION`` headers.
 
-        for line in content.split("\n"):
+        With a ``default_section``, plain lines before any header are tasks
+        too, which is how daily task files are usually written.
+        """
+        current_section = None
+
+        for line in lines:
             line = line.strip()
 
             # Skip empty lines
@@ -62,15 +137,11 @@ class TaskFileService:
                 continue
 
             # Detect section headers (must check before comment skip)
-            if line.startswith("## ACCOMPLISHED"):
-                current_section = "accomplished"
-                continue
-            elif line.startswith("## IN PROGRESS"):
-                current_section = "in_progress"
-                continue
-            elif line.startswith("## BLOCKERS"):
-                current_section = "blockers"
-                continue
+            if line.startswith("## "):
+                header = self._match_section_header(line)
+                if header:
+                    current_section = header
+                    continue
 
             # Skip comment lines (single #)
             if line.startswith("#"):
@@ -80,11 +151,137 @@ class TaskFileService:
             if line.startswith("-") and current_section:
                 task_text = line[1:].strip()
                 if task_text:
-                    task = self._parse_task_line(task_text, status_map[current_section])
-                    result[current_section].append(task)
+                    yield current_section, self._parse_task_line(
+                        task_text, self.STATUS_MAP[current_section]
+                    )
+            elif current_section is None and default_section:
+                task_text = line.lstrip("-").strip()
+                if task_text:
+                    yield default_section, self._parse_task_line(
+                        task_text, self.STATUS_MAP[default_section]
+                    )
 
-        return result
+    def _iter_daily_tasks(
+        self,
+        week_start: Optional[datetime],
+        week_end: Optional[datetime]
+    ) -> Iterator[tuple[str, Task]]:
+        """Stream tasks from the daily files dated within the week, oldest first."""
+        files = self._select_daily_files(week_start, week_end)
+        if not files:
+            return
+
+        cache = self._load_cache()
+        entries: dict[str, list] = {}
+        stale = []
+        for path, _ in files:
+            stat = path.stat()
+            key = str(path.resolve())
+            cached = cache.get(key)
+            if cached and (cached["mtime_ns"], cached["size"]) == (stat.st_mtime_ns, stat.st_size):
+                entries[key] = cached["tasks"]
+                self.files_cached += 1
+            else:
+                stale.append((key, path, stat))
+
+        if stale:
+            from concurrent.futures import ThreadPoolExecutor
+
+            workers = min(self.jobs, len(stale))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parsed = pool.map(self._parse_daily_file, (path for _, path, _ in stale))
+                for (key, _, stat), tasks in zip(stale, parsed):
+                    entries[key] = tasks
+                    cache[key] = {
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "tasks": tasks
+                    }
+            self.files_parsed += len(stale)
+            self._cache_dirty = True
+            self._save_cache()
+
+        for path, date in files:
+            for section, topic, title in entries[str(path.resolve())]:
+                yield section, Task(
+                    title=title,
+                    topic=topic,
+                    status=self.STATUS_MAP[section],
+                    date=date
+                )
+
+    def _select_daily_files(
+        self,
+        week_start: Optional[datetime],
+        week_end: Optional[datetime]
+    ) -> list[tuple[Path, datetime]]:
+        """Find daily task files by name, keeping those dated within the week."""
+        if self.file_path.is_dir():
+            candidates = self.file_path.glob(self.DAILY_FILE_GLOB)
+        else:
+            candidates = (Path(p) for p in glob.iglob(str(self.file_path)))
+
+        first = week_start.date() if week_start else None
+        last = week_end.date() if week_end else None
+        files = []
+        for path in candidates:
+            match = self.DAILY_FILE_PATTERN.match(path.name)
+            if not match or not path.is_file():
+                continue
+            try:
+                date = datetime.strptime(match.group(1), "%Y%m%d")
+            except ValueError:
+                continue
+            if (first and date.date() < first) or (last and date.date() > last):
+                continue
+            files.append((path, date))
+
+        files.sort(key=lambda item: (item[1], item[0].name))
+        return files
+
+    def _parse_daily_file(self, path: Path) -> list[list[Optional[str]]]:
+        """Parse one daily file into cacheable ``[section, topic, title]`` rows."""
+        with path.open("r", encoding="utf-8") as f:
+            return [
+                [section, task.topic, task.title]
+                for section, task in self._iter_lines(f, default_section="accomplished")
+            ]
+
+    def _load_cache(self) -> dict[str, dict]:
+        """Load the parse cache, ignoring missing or outdated files."""
+        if self._cache is None:
+            self._cache = {}
+            if self.cache_path and self.cache_path.exists():
+                try:
+                    data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                    if data.get("version") == self.CACHE_VERSION:
+                        self._cache = data.get("files", {})
+                except (OSError, ValueError):
+                    pass
+        return self._cache
+
+    def _save_cache(self) -> None:
+        """Write the parse cache atomically."""
+        if not self.cache_path or not self._cache_dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"version": self.CACHE_VERSION, "files": self._cache}),
+            encoding="utf-8"
+        )
+        os.replace(tmp_path, self.cache_path)
+        self._cache_dirty = False
+
+    def _match_section_header(self, line: str) -> Optional[str]:
+        """Get the section key for a ``## SECTION`` header line."""
+        for prefix, section in self.SECTION_HEADERS:
+            if line.startswith(prefix):
+                return section
+        return None
 
     def file_exists(self) -> bool:
-        """Check if task file exists."""
+        """Check if task file exists (or, for daily files, any of them)."""
+        if self.is_daily:
+            return bool(self._select_daily_files(None, None))
         return self.file_path.exists()
@@ -0,0 +1,137 @@
+"""Precompiled string templates and fast-path escaping for the renderers."""
+
+import re
+from string import Formatter
+from typing import Iterable, Iterator, Optional, Union
+
+
+# Characters that must be escaped in XML/HTML text and attribute values
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']")
+
+_FORMATTER = Formatter()
+
+
+def escape(text: str) -> str:
+    """Escape special XML/HTML characters.
+
+    A single regex scan short-circuits the common case of text that needs no
+    escaping. Otherwise the C-level ``str.replace`` chain is used, which
+    measures faster in CPython than ``str.translate`` or ``re.sub`` with
+    multi-character replacements.
+    """
+    if _NEEDS_ESCAPE.search(text) is None:
+        return text
+    return (text
+            .replace("&", "&amp;")
+            .replace("<", "&lt;")
+            .replace(">", "&gt;")
+            .replace('"', "&quot;")
+            .replace("'", "&apos;"))
+
+
+class CompiledTemplate:
+    """A ``str.format``-style template split once into static and dynamic segments.
+
+    Fields can be bound ahead of time with ``bind``, which folds their values
+    into the static text, so each render only fills what actually varies.
+    """
+
+    def __init__(self, source: str):
+        segments = []
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(source):
+            field = None
+            if field_name is not None:
+                field = (field_name, conversion, format_spec)
+            segments.append((literal, field))
+        self._set_segments(segments)
+
+    @classmethod
+    def _from_segments(cls, segments: list[tuple]) -> "CompiledTemplate":
+        template = cls.__new__(cls)
+        template._set_segments(segments)
+        return template
+
+    def _set_segments(self, segments: list[tuple]) -> None:
+        """Store segments, merging adjacent literals and precomputing the join layout."""
+        merged = []
+        pending = ""
+        for literal, field in segments:
+            pending += literal
+            if field is not None:
+                merged.append((pending, field))
+                pending = ""
+        if pending:
+            merged.append((pending, None))
+
+        self.segments = merged
+        self._parts = []
+        self._slots = []
+        for literal, field in merged:
+            self._parts.append(literal)
+            if field is not None:
+                self._slots.append((len(self._parts), field))
+                self._parts.append("")
+
+    @property
+    def fields(self) -> set[str]:
+        """Names of the fields still left to fill."""
+        return {
+            _field_root(field[0]) for _, field in self.segments if field is not None
+        }
+
+    def bind(self, **values) -> "CompiledTemplate":
+        """Return a new template with the given fields folded into the static text."""
+        segments = []
+        for literal, field in self.segments:
+            if field is not None and _field_root(field[0]) in values:
+                segments.append((literal + _format_field(field, values), None))
+            else:
+                segments.append((literal, field))
+        return self._from_segments(segments)
+
+    def render(self, **values) -> str:
+        """Fill the remaining fields and return the rendered text."""
+        parts = self._parts.copy()
+        for position, field in self._slots:
+            field_name, conversion, format_spec = field
+            if conversion or format_spec or field_name not in values:
+                parts[position] = _format_field(field, values)
+            else:
+                parts[position] = str(values[field_name])
+        return "".join(parts)
+
+    def iter_render(self, values: dict[str, Union[str, Iterable[str]]]) -> Iterator[str]:
+        """Fill the remaining fields as a stream of chunks.
+
+        Field values may be strings or iterables of strings, which are
+        streamed through without being joined.
+        """
+        for literal, field in self.segments:
+            if literal:
+                yield literal
+            if field is None:
+                continue
+            field_name = field[0]
+            value = values[field_name] if field_name in values else _format_field(field, values)
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+
+def _field_root(field_name: str) -> str:
+    """Get the argument name of a field such as ``colors[primary]``."""
+    end = len(field_name)
+    for delimiter in ".[":
+        position = field_name.find(delimiter)
+        if position != -1:
+            end = min(end, position)
+    return field_name[:end]
+
+
+def _format_field(field: tuple[str, Optional[str], str], values: dict) -> str:
+    """Resolve and format a single field the same way ``str.format`` would."""
+    field_name, conversion, format_spec = field
+    value, _ = _FORMATTER.get_field(field_name, (), values)
+    value = _FORMATTER.convert_field(value, conversion)
+    return _FORMATTER.format_field(value, format_spec or "")
@@ -0,0 +1,137 @@
+"""Blocking change notification for a file or directory."""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+
+def stat_signature(path: Path) -> tuple:
+    """Identify the current state of a file (or a directory's files) by inode, size and mtime.
+
+    Returns an empty tuple if the path does not exist.
+    """
+    try:
+        if path.is_dir():
+            entries = []
+            for entry in os.scandir(path):
+                if entry.is_file():
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+            return tuple(sorted(entries))
+        stat = path.stat()
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return ()
+
+
+class FileWatcher:
+    """Waits for a file (or the files in a directory) to change.
+
+    On Linux the containing directory is watched with inotify, so waiting
+    costs no CPU and editors that save by renaming a temporary file are
+    handled. Elsewhere, or if inotify is unavailable, the path is polled with
+    ``stat`` every ``poll_interval`` seconds.
+    """
+
+    # IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    INOTIFY_MASK = 0x002 | 0x004 | 0x008 | 0x040 | 0x080 | 0x100 | 0x200
+    INOTIFY_EVENT = struct.Struct("iIII")
+
+    def __init__(self, path: str, poll_interval: float = 1.0, debounce: float = 0.2):
+        self.path = Path(path)
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self._watch_dir = self.path if self.path.is_dir() else self.path.parent
+        self._signature = self._stat_signature()
+        self._fd = self._init_inotify()
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._fd is not None else "polling"
+
+    def _init_inotify(self) -> Optional[int]:
+        """Set up an inotify watch on the directory, or return None if unsupported."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            watch_dir = os.fsencode(self._watch_dir.resolve())
+            if libc.inotify_add_watch(fd, watch_dir, self.INOTIFY_MASK) < 0:
+                os.close(fd)
+                return None
+        except (OSError, AttributeError):
+            return None
+        return fd
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the path changes.
+
+        Bursts of events (an editor writing in several steps) are coalesced
+        into one change. Returns False if ``timeout`` seconds pass first.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if self._fd is not None:
+                changed = self._wait_inotify(remaining)
+            else:
+                changed = self._wait_polling(remaining)
+            if changed:
+                signature = self._stat_signature()
+                if signature != self._signature:
+                    self._signature = signature
+                    return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def _wait_inotify(self, timeout: Optional[float]) -> bool:
+        """Wait for a relevant inotify event, then for the burst to settle."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready or not self._read_events():
+            return False
+        while select.select([self._fd], [], [], self.debounce)[0]:
+            self._read_events()
+        return True
+
+    def _read_events(self) -> bool:
+        """Drain pending inotify events; True if any concerns the watched path."""
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:
+            return False
+        if self.path.is_dir():
+            return bool(data)
+
+        relevant = False
+        name = os.fsencode(self.path.name)
+        offset = 0
+        while offset + self.INOTIFY_EVENT.size <= len(data):
+            _, _, _, length = self.INOTIFY_EVENT.unpack_from(data, offset)
+            offset += self.INOTIFY_EVENT.size
+            if data[offset:offset + length].rstrip(b"\0") == name:
+                relevant = True
+            offset += length
+        return relevant
+
+    def _wait_polling(self, timeout: Optional[float]) -> bool:
+        """Sleep one poll interval (or until the timeout) and report whether the path changed."""
+        interval = self.poll_interval if timeout is None else min(self.poll_interval, timeout)
+        time.sleep(interval)
+        return self._stat_signature() != self._signature
+
+    def _stat_signature(self) -> tuple:
+        return stat_signature(self.path)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
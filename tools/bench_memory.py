@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Memory benchmark for task storage: dataclass objects vs. TaskTable.
+
+Usage:
+    python tools/bench_memory.py [--tasks N]
+"""
+
+import argparse
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+# Add src/main/python to path for imports
+src_path = Path(__file__).parent.parent / "src" / "main" / "python"
+sys.path.insert(0, str(src_path))
+
+from models.report import Report, Task, TaskStatus
+from models.task_table import TaskTable
+
+
+@dataclass
+class DictTask:
+    """The original Task layout, with a per-instance ``__dict__``."""
+    title: str
+    topic: Optional[str] = None
+    description: Optional[str] = None
+    status: TaskStatus = TaskStatus.COMPLETED
+    commit_hash: Optional[str] = None
+    pr_number: Optional[int] = None
+    date: Optional[datetime] = None
+    repo: Optional[str] = None
+
+
+def iter_task_fields(task_count: int):
+    """Yield commit-like task fields: unique subjects, few topics, short hashes."""
+    start = datetime(2020, 1, 1)
+    for i in range(task_count):
+        yield dict(
+            title=f"Fix DVFS handshake timeout in power domain {i} after review",
+            topic=f"Topic {i % 25}" if i % 3 else None,
+            status=TaskStatus.COMPLETED,
+            commit_hash=f"{i * 2654435761 % (1 << 28):07x}",
+            date=start + timedelta(minutes=17 * i),
+            repo=f"repo-{i % 4}"
+        )
+
+
+def measure(build) -> tuple[int, object]:
+    """Return the bytes still allocated by ``build()`` and its result."""
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=200000, help="Tasks to store")
+    args = parser.parse_args()
+
+    dict_bytes, _ = measure(lambda: [DictTask(**f) for f in iter_task_fields(args.tasks)])
+    slots_bytes, _ = measure(lambda: [Task(**f) for f in iter_task_fields(args.tasks)])
+    table_bytes, table = measure(lambda: TaskTable(Task(**f) for f in iter_task_fields(args.tasks)))
+
+    # Rendering-style iteration over a compact report only holds one row at a time
+    report = Report(author="Bench", week_start=datetime(2020, 1, 1), week_end=datetime(2020, 1, 7))
+    report.accomplished.tasks = table
+    tracemalloc.start()
+    for task in report.accomplished.tasks:
+        task.to_dict()
+    iter_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print(f"tasks:               {args.tasks}")
+    print(f"dataclass (__dict__): {dict_bytes / args.tasks:8.1f} B/task")
+    print(f"dataclass (slots):    {slots_bytes / args.tasks:8.1f} B/task")
+    print(f"TaskTable:            {table_bytes / args.tasks:8.1f} B/task")
+    print(f"TaskTable iter peak:  {iter_peak / 1024:8.1f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for per-slide and per-item rendering cost.
+
+Usage:
+    python tools/bench_render.py [--tasks N] [--repeat N]
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+# Add src/main/python to path for imports
+src_path = Path(__file__).parent.parent / "src" / "main" / "python"
+sys.path.insert(0, str(src_path))
+
+from models.report import Report, Task, TaskStatus
+from services.html_renderer import HtmlRenderer
+from services.svg_renderer import SvgRenderer
+
+
+def build_report(task_count: int) -> Report:
+    """Build a synthetic report with a mix of statuses and escapable titles."""
+    report = Report(
+        author="Bench Author",
+        week_start=datetime(2026, 1, 12),
+        week_end=datetime(2026, 1, 18, 23, 59, 59)
+    )
+    sections = [
+        (report.accomplished, TaskStatus.COMPLETED),
+        (report.in_progress, TaskStatus.IN_PROGRESS),
+        (report.blockers, TaskStatus.BLOCKED)
+    ]
+    for i in range(task_count):
+        section, status = sections[i % len(sections)]
+        title = f"Task {i}: reviewed the DMA <-> DVFS handshake & updated specs " * 2
+        if i % 2:
+            title = f"Task {i}: plain title without any markup characters at all"
+        section.add_task(Task(
+            title=title,
+            topic=f"Topic {i % 25}",
+            status=status,
+            commit_hash=f"{i:07x}",
+            date=datetime(2026, 1, 12 + i % 7)
+        ))
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks in the report")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    report = build_report(args.tasks)
+    tasks = report.accomplished.tasks + report.in_progress.tasks + report.blockers.tasks
+    svg = SvgRenderer()
+    html = HtmlRenderer()
+
+    def render_slides():
+        for i, task in enumerate(tasks, 1):
+            svg.render_task(task, i, len(tasks), report.author, report.week_string)
+
+    slide_time = min(timeit.repeat(render_slides, number=1, repeat=args.repeat))
+    html_time = min(timeit.repeat(lambda: html.render(report), number=1, repeat=args.repeat))
+
+    print(f"tasks:          {len(tasks)}")
+    print(f"svg per slide:  {slide_time / len(tasks) * 1e6:8.1f} us")
+    print(f"html per item:  {html_time / len(tasks) * 1e6:8.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark report snapshots against JSON for save, load and size.
+
+Usage:
+    python tools/bench_snapshot.py [--tasks N] [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+# Add src/main/python to path for imports
+src_path = Path(__file__).parent.parent / "src" / "main" / "python"
+sys.path.insert(0, str(src_path))
+
+from bench_render import build_report
+from models.report import Report, Task, TaskStatus
+
+
+def report_from_json(text: str) -> Report:
+    """Rebuild a report from ``Report.to_dict`` JSON, for a like-for-like load."""
+    data = json.loads(text)
+    report = Report(
+        author=data["author"],
+        week_start=datetime.fromisoformat(data["week_start"]),
+        week_end=datetime.fromisoformat(data["week_end"]),
+        generated_at=datetime.fromisoformat(data["generated_at"])
+    )
+    for key in ("accomplished", "in_progress", "blockers"):
+        section = getattr(report, key)
+        for t in data[key]["tasks"]:
+            section.add_task(Task(
+                title=t["title"],
+                topic=t["topic"],
+                description=t["description"],
+                status=TaskStatus(t["status"]),
+                commit_hash=t["commit_hash"],
+                pr_number=t["pr_number"],
+                date=datetime.fromisoformat(t["date"]) if t["date"] else None,
+                repo=t["repo"]
+            ))
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=100000, help="Tasks in the report")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    args = parser.parse_args()
+
+    report = build_report(args.tasks)
+    snapshot = report.to_snapshot()
+    json_text = json.dumps(report.to_dict())
+    assert Report.from_snapshot(snapshot).to_dict() == report.to_dict()
+
+    def best(func) -> float:
+        return min(timeit.repeat(func, number=1, repeat=args.repeat))
+
+    rows = [
+        ("snapshot", len(snapshot), best(report.to_snapshot),
+         best(lambda: Report.from_snapshot(snapshot))),
+        ("json", len(json_text.encode("utf-8")), best(lambda: json.dumps(report.to_dict())),
+         best(lambda: report_from_json(json_text)))
+    ]
+
+    print(f"tasks: {args.tasks}")
+    print(f"{'format':<10} {'size':>12} {'save':>10} {'load':>10}")
+    for name, size, save_time, load_time in rows:
+        print(f"{name:<10} {size:>12,} {save_time * 1e3:>8.1f}ms {load_time * 1e3:>8.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""End-to-end benchmark suite with JSON results and regression thresholds.
+
+Generates synthetic task files (long titles, many topics) and throwaway
+local git repositories, then times task file parsing, commit queries, HTML
+and SVG rendering and the full SVG slide export. Results are written as
+JSON. Given a baseline from an earlier run, every benchmark that slowed
+down by more than its threshold is reported and the exit status is 1.
+
+Thresholds are ratios of current to baseline time. ``--threshold`` sets the
+default; ``--limit PATTERN=RATIO`` (fnmatch on the benchmark name) or a
+``"thresholds"`` object in the baseline file override it per benchmark.
+
+Usage:
+    python tools/bench_suite.py [--sizes 10,1000,100000] [--commits 1000,100000]
+                                [--repeat N] [--output FILE] [--baseline FILE]
+                                [--threshold RATIO] [--limit PATTERN=RATIO ...]
+"""
+
+import argparse
+import fnmatch
+import json
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable
+
+# Add src/main/python to path for imports
+src_path = Path(__file__).parent.parent / "src" / "main" / "python"
+sys.path.insert(0, str(src_path))
+
+from core.generator import ReportGenerator
+from models.report import Report
+from services.git_executor import GitExecutor
+from services.git_service import GitService
+from services.html_renderer import HtmlRenderer
+from services.svg_renderer import SvgRenderer
+from services.task_file_service import TaskFileService
+
+RESULTS_VERSION = 1
+
+WORDS = (
+    "refactored", "the", "DMA", "scheduler", "<->", "DVFS", "handshake", "&", "reviewed",
+    "power", "domain", "sequencing", "for", "modem", "bring-up", "fixed", "regression",
+    "in", "thermal", "throttling", "policy", "updated", "spec", "\"v2\"", "migrated",
+    "CI", "pipeline", "to", "cached", "builds", "débogué", "l'interface", "日本語", "ドキュメント",
+)
+SECTIONS = ("## ACCOMPLISHED", "## IN PROGRESS", "## BLOCKERS")
+AUTHORS = [(f"Bench Author {i}", f"author{i}@example.com") for i in range(12)]
+# Commits are spread over one year, oldest first
+HISTORY_START = datetime(2025, 1, 6, tzinfo=timezone.utc)
+HISTORY_SPAN = timedelta(days=364)
+
+
+def long_title(rng: random.Random, index: int) -> str:
+    """A 100-300 character title with markup characters and non-ASCII text."""
+    words = [rng.choice(WORDS) for _ in range(rng.randint(15, 45))]
+    return f"Task {index}: " + " ".join(words)
+
+
+def write_task_file(path: Path, task_count: int, seed: int = 0) -> None:
+    """Write a task file with ``task_count`` tasks over roughly ``task_count / 20`` topics."""
+    rng = random.Random(seed)
+    topics = max(5, task_count // 20)
+    lines = ["# Synthetic benchmark tasks"]
+    for section_index, header in enumerate(SECTIONS):
+        lines.append("")
+        lines.append(header)
+        for i in range(section_index, task_count, len(SECTIONS)):
+            lines.append(f"- [Topic {rng.randrange(topics)}] {long_title(rng, i)}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+def create_git_repo(path: Path, commit_count: int, seed: int = 0) -> None:
+    """Create a repository with ``commit_count`` commits by several authors, via fast-import."""
+    rng = random.Random(seed)
+    path.mkdir(parents=True)
+    subprocess.run(["git", "init", "-q", "-b", "main", str(path)], check=True)
+
+    step = HISTORY_SPAN / max(1, commit_count)
+    start = int(HISTORY_START.timestamp())
+    chunks = []
+    for i in range(commit_count):
+        name, email = AUTHORS[rng.randrange(len(AUTHORS))]
+        timestamp = start + int((step * i).total_seconds())
+        message = f"[Topic {rng.randrange(200)}] {long_title(rng, i)}\n".encode("utf-8")
+        chunks.append(
+            f"commit refs/heads/main\n"
+            f"author {name} <{email}> {timestamp} +0000\n"
+            f"committer {name} <{email}> {timestamp} +0000\n"
+            f"data {len(message)}\n".encode("utf-8")
+        )
+        chunks.append(message)
+        chunks.append(b"\n")
+    subprocess.run(
+        ["git", "fast-import", "--quiet"], cwd=path, input=b"".join(chunks), check=True
+    )
+
+
+def best_time(func: Callable[[], object], repeat: int) -> float:
+    """Best wall time of ``repeat`` calls, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def report_from_tasks(tasks: dict) -> Report:
+    report = Report(
+        author="Bench Author",
+        week_start=datetime(2026, 1, 12),
+        week_end=datetime(2026, 1, 18, 23, 59, 59)
+    )
+    for key, section in zip(report.SECTION_KEYS, report.sections):
+        for task in tasks[key]:
+            section.add_task(task)
+    return report
+
+
+def run_benchmarks(args: argparse.Namespace, work_dir: Path) -> dict[str, dict]:
+    """Run every benchmark and return results keyed by benchmark name."""
+    results = {}
+
+    def record(name: str, seconds: float, items: int) -> None:
+        results[name] = {"seconds": seconds, "items": items}
+        per_item = seconds / max(1, items) * 1e6
+        print(f"  {name:<36} {seconds * 1000:>10.2f} ms  {per_item:>9.2f} us/item", flush=True)
+
+    html = HtmlRenderer()
+    svg = SvgRenderer()
+    for size in args.sizes:
+        task_file = work_dir / f"tasks_{size}.txt"
+        write_task_file(task_file, size)
+        service = TaskFileService(str(task_file))
+        record(f"task_file.read_tasks[{size}]",
+               best_time(service.read_tasks, args.repeat), size)
+
+        report = report_from_tasks(service.read_tasks())
+        record(f"html.render[{size}]", best_time(lambda: html.render(report), args.repeat), size)
+
+        if size > args.max_slides:
+            continue
+        tasks = [task for section in report.sections for task in section.tasks]
+
+        def render_slides() -> None:
+            for i, task in enumerate(tasks, 1):
+                svg.render_task(task, i, len(tasks), report.author, report.week_string)
+
+        record(f"svg.render_task[{size}]", best_time(render_slides, args.repeat), size)
+
+        generator = ReportGenerator(repo_path=str(work_dir))
+        slides_dir = work_dir / f"slides_{size}"
+        record(
+            f"save_svg_slides[{size}]",
+            best_time(lambda: generator.save_svg_slides(report, str(slides_dir), incremental=False),
+                      args.repeat),
+            size + 1
+        )
+
+    # A day of margin on both sides, as git reads the bounds in local time
+    since = HISTORY_START.replace(tzinfo=None) - timedelta(days=1)
+    until = (HISTORY_START + HISTORY_SPAN).replace(tzinfo=None) + timedelta(days=1)
+    # Shared, so repeated queries do not each start git helper processes
+    executor = GitExecutor()
+    for commit_count in args.commits:
+        repo = work_dir / f"repo_{commit_count}"
+        start = time.perf_counter()
+        create_git_repo(repo, commit_count)
+        print(f"  (created {commit_count} commits in {time.perf_counter() - start:.1f}s)", flush=True)
+
+        def query() -> None:
+            # A fresh service, so no in-memory query cache answers the call
+            commits = GitService(str(repo), executor=executor).get_commits(since, until)
+            if len(commits) != commit_count:
+                raise RuntimeError(f"expected {commit_count} commits, got {len(commits)}")
+
+        record(f"git.get_commits[{commit_count}]", best_time(query, args.repeat), commit_count)
+    return results
+
+
+def find_regressions(
+    results: dict[str, dict],
+    baseline: dict,
+    default_threshold: float,
+    limits: list[tuple[str, float]]
+) -> list[str]:
+    """Compare results with a baseline run; describe every benchmark over its threshold."""
+    thresholds = list(baseline.get("thresholds", {}).items()) + limits
+    regressions = []
+    print(f"\n{'benchmark':<38} {'baseline':>10} {'current':>10} {'ratio':>7} {'limit':>7}")
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or previous["seconds"] <= 0:
+            continue
+        limit = default_threshold
+        for pattern, ratio in thresholds:
+            # Later patterns (command line after file) take precedence
+            if fnmatch.fnmatchcase(name, pattern):
+                limit = ratio
+        ratio = result["seconds"] / previous["seconds"]
+        flag = "  REGRESSION" if ratio > limit else ""
+        print(f"{name:<38} {previous['seconds'] * 1000:>8.2f}ms {result['seconds'] * 1000:>8.2f}ms "
+              f"{ratio:>6.2f}x {limit:>6.2f}x{flag}")
+        if ratio > limit:
+            regressions.append(f"{name}: {ratio:.2f}x slower than baseline (limit {limit:.2f}x)")
+    return regressions
+
+
+def parse_counts(value: str) -> list[int]:
+    return [int(part) for part in value.split(",") if part.strip()]
+
+
+def parse_limit(value: str) -> tuple[str, float]:
+    pattern, sep, ratio = value.rpartition("=")
+    if not sep or not pattern:
+        raise argparse.ArgumentTypeError(f"expected PATTERN=RATIO, got {value!r}")
+    return pattern, float(ratio)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=parse_counts, default=[10, 1000, 100000],
+                        help="Task file sizes, comma-separated (default: 10,1000,100000)")
+    parser.add_argument("--commits", type=parse_counts, default=[1000, 100000],
+                        help="Commit counts of the generated repositories (default: 1000,100000)")
+    parser.add_argument("--max-slides", type=int, default=1000,
+                        help="Skip the SVG benchmarks for task files larger than this (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is kept)")
+    parser.add_argument("--output", default=None, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", default=None, help="Results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Default allowed slowdown ratio against the baseline (default: 1.25)")
+    parser.add_argument("--limit", type=parse_limit, action="append", default=[],
+                        metavar="PATTERN=RATIO", help="Allowed slowdown for matching benchmarks")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        if baseline.get("version") != RESULTS_VERSION:
+            print(f"Unsupported baseline version in {args.baseline}", file=sys.stderr)
+            return 2
+
+    with tempfile.TemporaryDirectory(prefix="bench-") as tmp:
+        results = run_benchmarks(args, Path(tmp))
+
+    data = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results
+    }
+    if baseline and "thresholds" in baseline:
+        data["thresholds"] = baseline["thresholds"]
+    if args.output:
+        Path(args.output).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {args.output}")
+
+    if baseline is None:
+        return 0
+    regressions = find_regressions(results, baseline, args.threshold, args.limit)
+    for regression in regressions:
+        print(f"FAIL {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
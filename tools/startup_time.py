@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Measure CLI startup and check that each mode only imports what it needs.
+
+Runs ``run.py`` under ``python -X importtime`` for a few common modes and
+fails if a mode imports a module it should load lazily (the HTTP server,
+SQLite, multiprocessing, the renderers of other modes, ...) or, with
+``--budget-ms``, if its total import time exceeds the budget.
+
+Usage:
+    python tools/startup_time.py [--repeat N] [--budget-ms MS] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RUN_PY = Path(__file__).resolve().parent.parent / "run.py"
+
+# Only needed by --serve, --archive/--stale-blockers/--topic-trend, -j N,
+# --watch, snapshots, git runs with a cache and multi-repository runs
+OPTIONAL_MODULES = (
+    "api.server",
+    "http.server",
+    "services.archive_service",
+    "services.commit_index",
+    "models.snapshot",
+    "sqlite3",
+    "multiprocessing",
+    "concurrent.futures",
+    "ctypes",
+    "core.watch",
+    "utils.file_watcher",
+    "services.journal_service",
+)
+
+# name, CLI arguments, modules that must not be imported
+SCENARIOS = (
+    ("help", ["--help"], OPTIONAL_MODULES + (
+        "services.html_renderer", "services.svg_renderer", "services.deck_renderer",
+    )),
+    ("html", ["--print"], OPTIONAL_MODULES + (
+        "services.svg_renderer", "services.deck_renderer",
+    )),
+    ("svg", ["--svg"], OPTIONAL_MODULES + (
+        "services.html_renderer", "services.deck_renderer",
+    )),
+)
+
+TASK_FILE = """## ACCOMPLISHED
+- [Startup] Measure import time
+## IN PROGRESS
+- [Startup] Keep it low
+"""
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Map module name to (self, cumulative) import time in microseconds."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        modules[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return modules
+
+
+def run_scenario(args: list[str], work_dir: Path) -> tuple[float, dict[str, tuple[int, int]]]:
+    """Run the CLI once; return wall time in seconds and its import times."""
+    command = [sys.executable, "-X", "importtime", str(RUN_PY), *args]
+    start = time.perf_counter()
+    result = subprocess.run(command, cwd=work_dir, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr[-2000:]}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per mode (median is reported)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Fail if a mode's median total import time exceeds this")
+    parser.add_argument("--top", type=int, default=8, help="Slowest modules to list per mode")
+    args = parser.parse_args()
+
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        work_dir = Path(tmp)
+        task_file = work_dir / "tasks.txt"
+        task_file.write_text(TASK_FILE, encoding="utf-8")
+        common = ["--task-file", str(task_file), "--author", "Startup", "--no-interactive",
+                  "--no-cache"]
+
+        print(f"{'mode':<6} {'wall':>9} {'imports':>9} {'modules':>8}")
+        for name, scenario_args, forbidden in SCENARIOS:
+            if scenario_args != ["--help"]:
+                scenario_args = [*scenario_args, *common]
+            runs = [run_scenario(scenario_args, work_dir) for _ in range(args.repeat)]
+            wall = statistics.median(elapsed for elapsed, _ in runs)
+            totals = [sum(own for own, _ in modules.values()) for _, modules in runs]
+            total_ms = statistics.median(totals) / 1000
+            modules = runs[-1][1]
+            print(f"{name:<6} {wall * 1000:>7.1f}ms {total_ms:>7.1f}ms {len(modules):>8}")
+
+            slowest = sorted(modules.items(), key=lambda item: item[1][0], reverse=True)
+            for module, (own, cumulative) in slowest[:args.top]:
+                print(f"         {own / 1000:>7.1f}ms self {cumulative / 1000:>7.1f}ms total  {module}")
+
+            for module in forbidden:
+                if module in modules:
+                    failures.append(f"{name}: imports {module}")
+            if args.budget_ms is not None and total_ms > args.budget_ms:
+                failures.append(f"{name}: {total_ms:.1f}ms of imports exceeds {args.budget_ms:.1f}ms")
+
+    for failure in failures:
+        print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())